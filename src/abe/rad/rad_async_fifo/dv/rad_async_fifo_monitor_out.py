@@ -56,7 +56,7 @@ class RadAsyncFifoReadMonitorOut(
             tr = await self.sample_dut(self._dut)
             # Only write to analysis port if this was a real read
             if tr is not None:
-                self.ap.write(tr)
+                self._ap_write(tr)
 
     # pylint: disable=line-too-long
     async def sample_dut(self, dut: Any) -> RadAsyncFifoReadItem | None:  # type: ignore[override]
@@ -66,7 +66,7 @@ class RadCdcMcpReadMonitorOut(
             tr = await self.sample_dut(self._dut)
             # Only write to analysis port if this was a real load
             if tr is not None:
-                self.ap.write(tr)
+                self._ap_write(tr)
 
     # pylint: enable=duplicate-code
     # pylint: disable=line-too-long
@@ -63,25 +63,23 @@ class BaseAgent(pyuvm.uvm_agent):
         super().build_phase()
         create = pyuvm.uvm_factory().create_component_by_type
         parent_inst_path = self.get_full_name()
+        specs: tuple[tuple[type[pyuvm.uvm_component], str], ...] = (
+            (BaseMonitorIn, "mon_in"),
+            (BaseMonitorOut, "mon_out"),
+        )
         if self.is_active == pyuvm.uvm_active_passive_enum.UVM_ACTIVE:
-            self.drv = create(
-                BaseDriver, parent_inst_path=parent_inst_path, name="drv", parent=self
-            )
-            self.sqr = create(
-                BaseSequencer,
-                parent_inst_path=parent_inst_path,
-                name="sqr",
-                parent=self,
+            specs = ((BaseDriver, "drv"), (BaseSequencer, "sqr"), *specs)
+        for comp_type, comp_name in specs:
+            setattr(
+                self,
+                comp_name,
+                create(
+                    comp_type,
+                    parent_inst_path=parent_inst_path,
+                    name=comp_name,
+                    parent=self,
+                ),
             )
-        self.mon_in = create(
-            BaseMonitorIn, parent_inst_path=parent_inst_path, name="mon_in", parent=self
-        )
-        self.mon_out = create(
-            BaseMonitorOut,
-            parent_inst_path=parent_inst_path,
-            name="mon_out",
-            parent=self,
-        )
         self.ap_in = pyuvm.uvm_analysis_port("ap_in", self)
         self.ap_out = pyuvm.uvm_analysis_port("ap_out", self)
         self.logger.debug("build_phase end")
@@ -99,17 +99,14 @@ class BaseClockDriver(BaseClockMixin, pyuvm.uvm_component):
         """Read per-instance config from uvm_config_db (once) with defaults."""
         self.logger.debug("_clock_driver_pull_config begin")
 
-        v = utils_dv.uvm_config_db_get_try(self, "clock_enable")
-        if isinstance(v, bool):
-            self.clock_enable = v
-
-        v = utils_dv.uvm_config_db_get_try(self, "clock_start_high")
-        if isinstance(v, bool):
-            self.clock_start_high = v
-
-        v = utils_dv.uvm_config_db_get_try(self, "clock_init_delay_ps")
-        if isinstance(v, int):
-            self.clock_init_delay_ps = v
+        get_typed = utils_dv.uvm_config_db_get_typed
+        self.clock_enable = get_typed(self, "clock_enable", bool, self.clock_enable)
+        self.clock_start_high = get_typed(
+            self, "clock_start_high", bool, self.clock_start_high
+        )
+        self.clock_init_delay_ps = get_typed(
+            self, "clock_init_delay_ps", int, self.clock_init_delay_ps
+        )
 
         if self.clock_enable and self.clock_period_ps <= 0:
             raise ValueError(f"clock_period_ps must be > 0, got {self.clock_period_ps}")
@@ -17,7 +17,7 @@ from cocotb.triggers import Timer
 from . import utils_dv
 
 
-class BaseClockMixin:
+class BaseClockMixin:  # pylint: disable=too-many-instance-attributes
     """Mixin providing clock configuration and timing utilities.
 
     This mixin is used by drivers and monitors to standardize clock-related
@@ -84,12 +84,13 @@ class BaseClockMixin:
         """Read per-instance config once (EoE)."""
         comp = self._as_comp()
         comp.logger.debug("_clock_pull_config begin")
-        v = utils_dv.uvm_config_db_get_try(comp, "clock_name")
-        if isinstance(v, str) and v:
-            self.clock_name = v
-        v = utils_dv.uvm_config_db_get_try(comp, "clock_period_ps")
-        if isinstance(v, int):
-            self.clock_period_ps = v
+        get_typed = utils_dv.uvm_config_db_get_typed
+        self.clock_name = (
+            get_typed(comp, "clock_name", str, self.clock_name) or self.clock_name
+        )
+        self.clock_period_ps = get_typed(
+            comp, "clock_period_ps", int, self.clock_period_ps
+        )
         if not self.drive_falling_edge and self.drive_frac_after > 0.0:
             if self.clock_period_ps <= 0:
                 raise ValueError(
@@ -122,10 +123,44 @@ class BaseClockMixin:
                     f"got {self.drive_frac_after}"
                 )
             self._postedge_delay_ps = int(self.clock_period_ps * self.drive_frac_after)
+        self._clock_bind_drive_edge()
         comp.logger.debug("clock_compute_skew end")
 
+    def _clock_bind_drive_edge(self) -> None:
+        """
+        Replace clock_drive_edge with a closure over the frozen edge config.
+        None of these knobs change after EoE, so the per-edge hot path needs no
+        attribute loads. Skipped if handles are not bound yet or a subclass
+        overrides clock_drive_edge (method fallback).
+        """
+        clk = self._clk
+        overridden = type(self).clock_drive_edge is not BaseClockMixin.clock_drive_edge
+        if clk is None or overridden:
+            return
+        delay_ps = self._postedge_delay_ps
+
+        if self.drive_falling_edge:
+
+            async def _edge() -> None:
+                await clk.falling_edge
+
+        elif delay_ps > 0:
+
+            async def _edge() -> None:
+                await clk.rising_edge
+                await Timer(delay_ps, unit="ps")
+
+        else:
+
+            async def _edge() -> None:
+                await clk.rising_edge
+
+        setattr(self, "clock_drive_edge", _edge)
+
     async def clock_drive_edge(self) -> None:
-        """Align to the driving edge (runtime)."""
+        """Align to the driving edge (runtime).
+        Shadowed per instance by a bound closure once clock_compute_skew runs,
+        unless a subclass overrides it."""
         assert (
             self._clk is not None
         ), "clock_drive_edge called before _clock_bind_handles"
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Any, Generic, TypeVar
 
 import pyuvm
@@ -20,7 +21,9 @@ from .base_item import BaseItem
 T = TypeVar("T", bound=BaseItem)
 
 
-class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
+class BaseDriver(  # pylint: disable=too-many-instance-attributes
+    BaseClockMixin, pyuvm.uvm_driver, Generic[T]
+):
     """UVM driver with clock synchronization and reset handling.
 
     This driver provides a complete framework for driving DUT inputs with proper
@@ -30,6 +33,7 @@ class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
     The driver:
     - Applies initial DUT input values at time 0 with proper delta cycle handling
     - Waits for reset assertion and deassertion before driving transactions
+    - Holds further transactions while reset is re-asserted mid-run
     - Provides timing alignment via clock_drive_edge() from BaseClockMixin
     - Uses level-triggered events to track reset state
 
@@ -40,9 +44,16 @@ class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
         initial_dut_input_values: Dict mapping signal names to initial values
         seq_item_port: TLM port for getting transactions from sequencer
 
+    Configuration:
+        requires_delta_settle (bool): Await ReadWrite + NextTimeStep after the
+            initial writes (default: True). Set False for backends without
+            delta cycles (e.g. a pybind architectural model), where writes take
+            effect immediately and the two awaits are pure overhead.
+
     Reset Events:
         _rst_asserted: Event set when reset is active
-        _rst_deasserted: Event set when reset is inactive
+        _rst_gate: Event set when reset is inactive (the drive loop's gate)
+        _rst_seen_full_cycle: Event set once reset deasserts after an assert
 
     Reference:
         C.E. Cummings, "Applying Stimulus & Sampling Outputs," SNUG 2016
@@ -62,8 +73,19 @@ class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
         self._reset_active: bool = False
         # Level-triggered events reflect current reset state
         self._rst_asserted: Event = Event()
-        self._rst_deasserted: Event = Event()
-        self._rst_deasserted.set()  # default: not in reset at t=0
+        self._rst_gate: Event = Event()
+        self._rst_gate.set()  # default: not in reset at t=0
+        # (event to set, event to clear), indexed by int(active)
+        self._rst_table: tuple[tuple[Event, Event], tuple[Event, Event]] = (
+            (self._rst_gate, self._rst_asserted),
+            (self._rst_asserted, self._rst_gate),
+        )
+        # Edge-triggered: first deassert-after-assert releases run_phase
+        self._rst_seen_assert: bool = False
+        self._rst_seen_full_cycle: Event = Event()
+        # (handle, value) pairs resolved once at end_of_elaboration_phase
+        self._initial_handles: list[tuple[Any, int]] = []
+        self.requires_delta_settle: bool = True
 
     def end_of_elaboration_phase(self) -> None:
         self.logger.debug("end_of_elaboration_phase begin")
@@ -71,15 +93,33 @@ class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
         self._clock_pull_config()
         self._clock_bind_handles()
         self.clock_compute_skew()
-        self.logger.debug("end_of_elaboration_phase begin")
+        self.requires_delta_settle = utils_dv.uvm_config_db_get_typed(
+            self, "requires_delta_settle", bool, self.requires_delta_settle
+        )
+        self._initial_handles = [
+            (getattr(self._dut, sig_name), val)
+            for sig_name, val in self.initial_dut_input_values.items()
+        ]
+        self.logger.debug("end_of_elaboration_phase end")
 
     async def run_phase(self) -> None:
         self.logger.debug("run_phase begin")
         tr: T
         await self.apply_initial_dut_inputs()
-        await self.wait_for_reset_active()
-        await self.wait_for_reset_inactive()
+        cls = type(self)
+        if (
+            cls.wait_for_reset_active is BaseDriver.wait_for_reset_active
+            and cls.wait_for_reset_inactive is BaseDriver.wait_for_reset_inactive
+        ):
+            await self._wait_reset_edge()
+        else:
+            # A subclass customizes the reset wait: go through its hooks
+            await self.wait_for_reset_active()
+            await self.wait_for_reset_inactive()
         while True:
+            # Steady state is a plain attribute check; only wait while in reset
+            if self._reset_active:
+                await self._rst_gate.wait()
             tr = await self.seq_item_port.get_next_item()
             await self.drive_item(self._dut, tr)
             self.seq_item_port.item_done()
@@ -88,13 +128,15 @@ class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
         """
         Reference: SNUG 2016 "Applying Stimulus & Sampling Outputs." Apply DUT
         inputs at time 0 using a non-blocking-style write and advance one delta
-        cycle to avoid races.
+        cycle to avoid races. The settle awaits are skipped when
+        requires_delta_settle is False.
         """
         self.logger.debug("apply_initial_dut_inputs begin")
-        for sig_name, val in self.initial_dut_input_values.items():
-            getattr(self._dut, sig_name).value = val
-        await ReadWrite()  # like an NBA at t=0
-        await NextTimeStep()  # advance one delta to be extra-safe
+        for handle, val in self._initial_handles:
+            handle.value = val
+        if self.requires_delta_settle:
+            await ReadWrite()  # like an NBA at t=0
+            await NextTimeStep()  # advance one delta to be extra-safe
         self.logger.debug("apply_initial_dut_inputs end")
 
     async def wait_for_reset_active(self) -> None:
@@ -106,20 +148,35 @@ class BaseDriver(BaseClockMixin, pyuvm.uvm_driver, Generic[T]):
     async def wait_for_reset_inactive(self) -> None:
         """Block until reset is deasserted (polarity-neutral)."""
         self.logger.debug("wait_for_reset_inactive begin")
-        await self._rst_deasserted.wait()
+        await self._rst_gate.wait()
         self.logger.debug("wait_for_reset_inactive end")
 
+    async def _wait_reset_edge(self) -> None:
+        """Block until reset has been asserted and then deasserted.
+
+        Equivalent to wait_for_reset_active() followed by
+        wait_for_reset_inactive(), but suspends on a single event. run_phase
+        uses it only when neither hook is overridden.
+        """
+        self.logger.debug("_wait_reset_edge begin")
+        await self._rst_seen_full_cycle.wait()
+        self.logger.debug("_wait_reset_edge end")
+
     def reset_change(self, value: int, active: bool) -> None:
         """Called by BaseResetSink on reset level changes."""
-        self.logger.debug("reset_change begin")
+        dbg = self.logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            self.logger.debug("reset_change begin")
         self._reset_active = active
+        set_evt, clear_evt = self._rst_table[int(active)]
+        set_evt.set()
+        clear_evt.clear()
         if active:
-            self._rst_asserted.set()
-            self._rst_deasserted.clear()
-        else:
-            self._rst_deasserted.set()
-            self._rst_asserted.clear()
-        self.logger.debug("reset_change end: value=%d active=%s", value, active)
+            self._rst_seen_assert = True
+        elif self._rst_seen_assert:
+            self._rst_seen_full_cycle.set()
+        if dbg:
+            self.logger.debug("reset_change end: value=%d active=%s", value, active)
 
     async def drive_item(self, dut: Any, tr: T) -> None:
         """Drive DUT signals for one transaction."""
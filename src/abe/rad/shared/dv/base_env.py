@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import pyuvm
 
 from . import utils_dv
@@ -19,6 +21,12 @@ from .base_reset_sink import BaseResetSink
 from .base_sb import BaseSb
 
 
+@functools.cache
+def _factory() -> pyuvm.UVMFactory:
+    """The factory singleton (pyuvm keeps it across run_test calls)."""
+    return pyuvm.uvm_factory()
+
+
 class BaseEnv(pyuvm.uvm_env):
     """Top-level UVM environment that builds and connects all verification components.
 
@@ -36,7 +44,8 @@ class BaseEnv(pyuvm.uvm_env):
         cov: Coverage collector (optional, controlled by coverage_en config)
         sb: Scoreboard for checking (optional, controlled by check_en config)
         mon_rst: Reset monitor observing reset signal
-        reset_sink: Component that forwards reset events to driver and predictor
+        reset_sink: Component that forwards reset events to the agents' drivers
+            and the predictor
 
     Configuration (via config_db):
         coverage_en (bool): Enable coverage collection (default: True)
@@ -67,17 +76,18 @@ class BaseEnv(pyuvm.uvm_env):
 
         super().build_phase()
 
-        create = pyuvm.uvm_factory().create_component_by_type
+        create = _factory().create_component_by_type
         parent_inst_path = self.get_full_name()
 
-        for idx in range(self.num_agents):
-            agent = create(
+        self.agents = [
+            create(
                 BaseAgent,
                 parent_inst_path=parent_inst_path,
                 name=f"agent{idx}",
                 parent=self,
             )
-            self.agents.append(agent)
+            for idx in range(self.num_agents)
+        ]
 
         cvrg = utils_dv.uvm_config_db_get_try(self, "coverage_en")
         if isinstance(cvrg, bool):
@@ -116,13 +126,33 @@ class BaseEnv(pyuvm.uvm_env):
     def connect_phase(self) -> None:
         self.logger.debug("connect_phase begin")
         super().connect_phase()
-        for agent in self.agents:
-            if self.cov is not None:
-                agent.ap_in.connect(self.cov.analysis_export)
-            if self.sb is not None:
-                agent.ap_in.connect(self.sb.prd.analysis_export)
-                agent.ap_out.connect(self.sb.cmp.out_fifo.analysis_export)
-            self.reset_sink.drv = agent.drv
+        # Decide the sink exports once, then wire every agent to them
+        in_exports: list[pyuvm.uvm_analysis_export] = []
+        out_exports: list[pyuvm.uvm_analysis_export] = []
+        if self.cov is not None:
+            in_exports.append(self.cov.analysis_export)
+        if self.sb is not None:
+            in_exports.append(self.sb.prd.analysis_export)
+            out_exports.append(self.sb.cmp.out_fifo.analysis_export)
+        conns = [
+            (agent.ap_in, export) for agent in self.agents for export in in_exports
+        ]
+        conns += [
+            (agent.ap_out, export) for agent in self.agents for export in out_exports
+        ]
+        for port, export in conns:
+            port.connect(export)
+        # One reset domain: every active agent's driver sees reset changes.
+        # The first goes in drv (read by sinks that override write()), the
+        # rest in drvs.
+        active_drvs = [
+            agent.drv
+            for agent in self.agents
+            if agent.is_active == pyuvm.uvm_active_passive_enum.UVM_ACTIVE
+        ]
+        if active_drvs:
+            self.reset_sink.drv = active_drvs[0]
+            self.reset_sink.drvs = active_drvs[1:]
         self.mon_rst.ap.connect(self.reset_sink.analysis_export)
         if self.sb is not None:
             self.reset_sink.sb_prd = self.sb.prd
@@ -10,11 +10,40 @@ from __future__ import annotations
 
 import copy
 import json
-from typing import Iterable, Self
+import operator
+from typing import Any, Callable, ClassVar, Iterable, NamedTuple, Self
 
 import pyuvm
 
 
+class _ItemFields(NamedTuple):
+    """Field-name tuples for one BaseItem subclass (declared and sorted order)."""
+
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    all: tuple[str, ...]
+    inputs_sorted: tuple[str, ...]
+    outputs_sorted: tuple[str, ...]
+    all_sorted: tuple[str, ...]
+    # Fetch all input/output values in one call. Compare results with == only:
+    # a single field yields a scalar, not a 1-tuple.
+    get_inputs: Callable[[Any], Any]
+    get_outputs: Callable[[Any], Any]
+
+
+# json.dumps({}); returned directly when an item has no fields to show
+_EMPTY_JSON = "{}"
+
+
+def _no_fields(_item: Any) -> tuple[()]:
+    return ()
+
+
+def _fields_getter(fields: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Return a C-level getter for fields (constant () if there are none)."""
+    return operator.attrgetter(*fields) if fields else _no_fields
+
+
 class BaseItem(pyuvm.uvm_sequence_item):
     """Base transaction item with field management and comparison utilities.
 
@@ -27,11 +56,19 @@ class BaseItem(pyuvm.uvm_sequence_item):
         _in_fields(): Return tuple of input field names
         _out_fields(): Return tuple of output field names
 
+    Field names must be static per class; they are snapshotted when the
+    subclass is created (or on first use, if that fails) and cached.
+
+    BaseItem declares empty __slots__, so subclasses may list their fields in
+    __slots__ to store them in slot descriptors. Instances still carry the
+    __dict__ inherited from pyuvm.uvm_sequence_item.
+
     The class provides:
-    - Deep cloning for safe transaction copies
+    - Field-wise cloning for safe transaction copies
     - Field-wise copying between items of the same type
     - Separate comparison of input and output fields
-    - JSON serialization for logging and debugging
+    - JSON serialization for logging and debugging (pass the item itself as a
+      logger %s argument so JSON is only built if the record is emitted)
     - Type-safe operations with runtime type checking
 
     Example:
@@ -49,6 +86,41 @@ class BaseItem(pyuvm.uvm_sequence_item):
         ...         return ("response",)
     """
 
+    __slots__ = ()
+
+    # Fields holding mutable containers that clone() must deep-copy.
+    _deep_fields: ClassVar[tuple[str, ...]] = ()
+
+    # Per-class field tuples, snapshotted by __init_subclass__ (or lazily on
+    # first use if the subclass cannot report its fields without an instance).
+    _FIELDS: ClassVar[_ItemFields | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = None
+        try:
+            # _in_fields/_out_fields only return literals; no __init__ needed
+            probe = cls.__new__(cls)  # pylint: disable=no-value-for-parameter
+            cls._FIELDS = probe._build_fields()
+        except (AttributeError, NotImplementedError, TypeError):
+            pass  # fall back to _cached_fields() on first use
+
+    def _build_fields(self) -> _ItemFields:
+        in_fields = tuple(self._in_fields())
+        out_fields = tuple(self._out_fields())
+        # Preserve declared order while removing duplicates if any overlap
+        all_fields = tuple(dict.fromkeys((*in_fields, *out_fields)))
+        return _ItemFields(
+            inputs=in_fields,
+            outputs=out_fields,
+            all=all_fields,
+            inputs_sorted=tuple(sorted(in_fields)),
+            outputs_sorted=tuple(sorted(out_fields)),
+            all_sorted=tuple(sorted(all_fields)),
+            get_inputs=_fields_getter(in_fields),
+            get_outputs=_fields_getter(out_fields),
+        )
+
     def _in_fields(self) -> Iterable[str]:
         """Fields considered *inputs* (randomized / constrained)."""
         return ()
@@ -57,19 +129,33 @@ class BaseItem(pyuvm.uvm_sequence_item):
         """Fields considered *outputs* (observed from DUT)."""
         return ()
 
+    def _cached_fields(self) -> _ItemFields:
+        """Return the field tuples, computed once per class."""
+        cached = self._FIELDS
+        if cached is None:
+            cached = self._build_fields()
+            type(self)._FIELDS = cached
+        return cached
+
     def _all_fields(self) -> tuple[str, ...]:
-        # Preserve declared order while removing duplicates if any overlap
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for f in list(self._in_fields()) + list(self._out_fields()):
-            if f not in seen:
-                seen.add(f)
-                ordered.append(f)
-        return tuple(ordered)
+        return self._cached_fields().all
 
     def clone(self) -> Self:
-        """Deep copy so the clone can diverge safely."""
-        return copy.deepcopy(self)
+        """Field-wise copy so the clone can diverge safely.
+
+        Bypasses the subclass __init__: the clone gets fresh pyuvm sequence-item
+        state plus the declared fields. Field values are shared by reference
+        except those listed in _deep_fields, which are deep-copied. Subclasses
+        carrying extra non-field state should override clone().
+        """
+        cls: type[Self] = type(self)
+        new = cls.__new__(cls)  # pylint: disable=no-value-for-parameter
+        pyuvm.uvm_sequence_item.__init__(new, self.get_name())
+        for f in self._cached_fields().all:
+            setattr(new, f, getattr(self, f))
+        for f in self._deep_fields:
+            setattr(new, f, copy.deepcopy(getattr(self, f)))
+        return new
 
     def copy_from(self, other: Self) -> None:
         """Field-wise copy from another item of the same concrete type (in+out)."""
@@ -84,31 +170,37 @@ class BaseItem(pyuvm.uvm_sequence_item):
         """Structured view for logging/JSON (in+out)."""
         return {f: getattr(self, f) for f in self._all_fields()}
 
+    def _json(self, fields: tuple[str, ...]) -> str:
+        """JSON of the given (pre-sorted) fields; same output as sort_keys=True."""
+        if not fields:
+            return _EMPTY_JSON
+        return json.dumps({f: getattr(self, f) for f in fields})
+
     def __str__(self) -> str:
-        return json.dumps(self.to_dict(), sort_keys=True)
+        return self._json(self._cached_fields().all_sorted)
 
     def inputs_str(self) -> str:
         """Return JSON string of input fields only."""
-        return json.dumps(
-            {f: getattr(self, f) for f in self._in_fields()}, sort_keys=True
-        )
+        return self._json(self._cached_fields().inputs_sorted)
 
     def outputs_str(self) -> str:
         """Return JSON string of output fields only."""
-        return json.dumps(
-            {f: getattr(self, f) for f in self._out_fields()}, sort_keys=True
-        )
+        return self._json(self._cached_fields().outputs_sorted)
 
     def compare_in(self, other: Self, *, fields: Iterable[str] | None = None) -> bool:
         """Compare only input fields."""
         if type(self) is not type(other):
             return False
-        flist = list(fields) if fields is not None else list(self._in_fields())
-        return all(getattr(self, f) == getattr(other, f) for f in flist)
+        if fields is None:
+            get = self._cached_fields().get_inputs
+            return bool(get(self) == get(other))
+        return all(getattr(self, f) == getattr(other, f) for f in fields)
 
     def compare_out(self, other: Self, *, fields: Iterable[str] | None = None) -> bool:
         """Compare only output fields."""
         if type(self) is not type(other):
             return False
-        flist = list(fields) if fields is not None else list(self._out_fields())
-        return all(getattr(self, f) == getattr(other, f) for f in flist)
+        if fields is None:
+            get = self._cached_fields().get_outputs
+            return bool(get(self) == get(other))
+        return all(getattr(self, f) == getattr(other, f) for f in fields)
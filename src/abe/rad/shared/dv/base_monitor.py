@@ -8,9 +8,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 import pyuvm
+from cocotb.handle import SimHandleBase
 
 from . import utils_dv
 from .base_clock_mixin import BaseClockMixin
@@ -19,7 +20,9 @@ from .base_item import BaseItem
 T = TypeVar("T", bound=BaseItem)
 
 
-class BaseMonitor(BaseClockMixin, pyuvm.uvm_monitor, Generic[T]):
+class BaseMonitor(  # pylint: disable=too-many-instance-attributes
+    BaseClockMixin, pyuvm.uvm_monitor, Generic[T]
+):
     """Base monitor with clock synchronization and analysis port infrastructure.
 
     This monitor provides the foundation for observing DUT signals and publishing
@@ -39,6 +42,16 @@ class BaseMonitor(BaseClockMixin, pyuvm.uvm_monitor, Generic[T]):
     Attributes:
         ap: Analysis port for broadcasting observed transactions
         item_count: Number of transactions observed (currently unused but available)
+        sig_names: DUT signal names whose handles are bound into sig at EoE
+        sig: Cached DUT handles by name; read self.sig[name].value per sample
+
+    Configuration:
+        sample_signal_name (str): Optional qualifier/strobe signal (default: "").
+            When set, sample_dut_edge() wakes on its rising edge instead of the
+            clock's. Generating the strobe in HDL (e.g. a clock enable or valid
+            that pulses once per transaction) means Python only wakes on
+            transactions rather than on every clock edge; ReadOnly still follows
+            the strobe edge, so #1step sampling semantics are preserved.
 
     Example:
         >>> class MyMonitor(BaseMonitor[MyItem]):
@@ -58,8 +71,13 @@ class BaseMonitor(BaseClockMixin, pyuvm.uvm_monitor, Generic[T]):
         self._clock_init_defaults()
         self.ap: pyuvm.uvm_analysis_port
         self.item_count: int = 0
+        self.sample_signal_name: str = ""
+        self.sig_names: tuple[str, ...] = ()
+        self.sig: dict[str, SimHandleBase] = {}
+        self._sample_signal: SimHandleBase | None = None
         # Bind once to help hot paths
         self._get_val = utils_dv.get_signal_value_int
+        self._ap_write: Callable[[Any], None]
 
     def build_phase(self) -> None:
         self.logger.debug("build_phase begin")
@@ -72,14 +90,40 @@ class BaseMonitor(BaseClockMixin, pyuvm.uvm_monitor, Generic[T]):
         super().end_of_elaboration_phase()
         self._clock_pull_config()
         self._clock_bind_handles()
+        self.sample_signal_name = utils_dv.uvm_config_db_get_typed(
+            self, "sample_signal_name", str, self.sample_signal_name
+        )
+        if self.sample_signal_name:
+            self._sample_signal = utils_dv.get_signal(
+                self._dut, self.sample_signal_name
+            )
+        # Like _get_val: resolve handles once so sample_dut skips DUT lookups.
+        # Only handles are cached; .value must still be read per sample.
+        self.sig = {n: utils_dv.get_signal(self._dut, n) for n in self.sig_names}
+        # Connections are final after connect_phase. With one subscriber (the
+        # usual agent ap_in), call its write directly and skip the broadcast.
+        subscribers = self.ap.subscribers
+        if len(subscribers) == 1 and hasattr(subscribers[0], "write"):
+            self._ap_write = subscribers[0].write
+        else:
+            self._ap_write = self.ap.write
         self.logger.debug("end_of_elaboration_phase end")
 
+    def _sample_edge_signal(self) -> SimHandleBase | None:
+        """Return the sample strobe if configured, else the clock."""
+        if self._sample_signal is not None:
+            return self._sample_signal
+        return self._clk
+
     async def run_phase(self) -> None:
         self.logger.debug("run_phase begin")
         tr: T
+        ap_write = self._ap_write
+        sample_dut = self.sample_dut
+        dut = self._dut
         while True:
-            tr = await self.sample_dut(self._dut)
-            self.ap.write(tr)
+            tr = await sample_dut(dut)
+            ap_write(tr)
 
     async def sample_dut_edge(self) -> None:
         """Wait until the edge to sample the DUT."""
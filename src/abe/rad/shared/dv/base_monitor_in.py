@@ -26,7 +26,7 @@ class BaseMonitorIn(BaseMonitor[T], Generic[T]):  # pylint: disable=too-many-anc
     consistent with SystemVerilog's #1step sampling.
 
     Sampling Strategy:
-        1. Wait for rising edge of clock
+        1. Wait for rising edge of clock (or of sample_signal_name, if set)
         2. Enter ReadOnly region (equivalent to SV #1step)
         3. Sample all input signals in a stable state
 
@@ -50,10 +50,9 @@ class BaseMonitorIn(BaseMonitor[T], Generic[T]):  # pylint: disable=too-many-anc
     """
 
     async def sample_dut_edge(self) -> None:
-        assert (
-            self._clk is not None
-        ), "sample_dut_edge called before _clock_bind_handles"
-        await self._clk.rising_edge
+        edge_sig = self._sample_edge_signal()
+        assert edge_sig is not None, "sample_dut_edge called before _clock_bind_handles"
+        await edge_sig.rising_edge
         await ReadOnly()
 
     async def sample_dut(self, dut: Any) -> T:
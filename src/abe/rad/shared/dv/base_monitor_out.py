@@ -27,7 +27,7 @@ class BaseMonitorOut(BaseMonitor[T], Generic[T]):  # pylint: disable=too-many-an
     the stable output values after sequential logic has updated.
 
     Sampling Strategy:
-        1. Wait for rising edge of clock (outputs update)
+        1. Wait for rising edge of clock (or of sample_signal_name, if set)
         2. Delay to just before next rising edge (default: period - 1ps)
         3. Enter ReadOnly region (equivalent to SV #1step)
         4. Sample all output signals in their stable state
@@ -72,17 +72,50 @@ class BaseMonitorOut(BaseMonitor[T], Generic[T]):  # pylint: disable=too-many-an
                 )
             )
         self.preedge_delay_ps = self.clock_period_ps - self.pre_ps
+        self._bind_sample_window()
         self.logger.debug("end_of_elaboration_phase end")
 
+    def _bind_sample_window(self) -> None:
+        """
+        Replace sample_dut_edge with a closure over cached triggers. The edge,
+        the pre-edge Timer, and the ReadOnly singleton are reusable, so the
+        per-sample path allocates no triggers and does no attribute loads.
+        Skipped if handles are not bound yet or a subclass overrides
+        sample_dut_edge (method fallback).
+        """
+        edge_sig = self._sample_edge_signal()
+        overridden = type(self).sample_dut_edge is not BaseMonitorOut.sample_dut_edge
+        if edge_sig is None or overridden:
+            return
+        rising = edge_sig.rising_edge
+        read_only = ReadOnly()
+
+        if self.preedge_delay_ps > 0:
+            preedge = Timer(self.preedge_delay_ps, unit="ps")
+
+            async def _sample_window() -> None:
+                await rising
+                await preedge
+                await read_only
+
+        else:
+
+            async def _sample_window() -> None:
+                await rising
+                await read_only
+
+        setattr(self, "sample_dut_edge", _sample_window)
+
     async def sample_dut_edge(self) -> None:
         """
         Wait rising edge, then delay to just-before next edge.
         Finalize with ReadOnly to be consistent with SV #1step.
+        Shadowed per instance by a bound closure at end_of_elaboration_phase,
+        unless a subclass overrides it.
         """
-        assert (
-            self._clk is not None
-        ), "sample_dut_edge called before _clock_bind_handles"
-        await self._clk.rising_edge
+        edge_sig = self._sample_edge_signal()
+        assert edge_sig is not None, "sample_dut_edge called before _clock_bind_handles"
+        await edge_sig.rising_edge
         if self.preedge_delay_ps > 0:
             await Timer(self.preedge_delay_ps, unit="ps")
         await ReadOnly()
@@ -7,7 +7,7 @@
 """Reference model of DUT."""
 
 import logging
-from typing import Generic, TypeVar
+from typing import ClassVar, Generic, TypeVar
 
 import pyuvm
 
@@ -31,6 +31,12 @@ class BaseRefModel(pyuvm.uvm_object, Generic[T]):
     Subclasses must implement:
         calc_exp(tr): Calculate expected output fields for a transaction
 
+    Attributes:
+        mutates_input (bool): Class-level; True (default) if calc_exp() writes
+            into tr, so the predictor passes it a clone. Set False only if
+            calc_exp() leaves tr untouched (e.g. returns a new item); the
+            predictor then skips the per-transaction clone.
+
     Reset Handling:
         The reset_change(value, active) method is called when reset state
         changes. Subclasses should override to reset internal state when
@@ -66,6 +72,12 @@ class BaseRefModel(pyuvm.uvm_object, Generic[T]):
         ...         return tr
     """
 
+    # pyuvm.uvm_object keeps a __dict__, so this does not shrink instances;
+    # it turns the base state into slot descriptors for faster access.
+    __slots__ = ("_logger", "_reset_active")
+
+    mutates_input: ClassVar[bool] = True
+
     def __init__(self, name: str = "ref_model") -> None:
         super().__init__(name)
         self._logger: logging.Logger = logging.getLogger(f"uvm.obj.{name}")
@@ -78,10 +90,30 @@ class BaseRefModel(pyuvm.uvm_object, Generic[T]):
 
     def reset_change(self, value: int, active: bool) -> None:
         """Handle a change in reset."""
-        self.logger.debug("reset_change begin")
+        dbg = self.logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            self.logger.debug("reset_change begin")
         self._reset_active = active
-        self.logger.debug("reset_change end: value = %d: active = %s", value, active)
+        if dbg:
+            self.logger.debug(
+                "reset_change end: value = %d: active = %s", value, active
+            )
 
     def calc_exp(self, tr: T) -> T:
         """Calculate expected output."""
         raise NotImplementedError
+
+    def calc_exp_batch(self, trs: list[T]) -> list[T]:
+        """Calculate expected outputs for a batch of transactions, in order.
+
+        Defaults to calc_exp() per item. Stateless, compute-heavy models can
+        override this to work on whole columns at once, e.g. with NumPy:
+
+            >>> a = np.fromiter((t.a for t in trs), dtype=np.uint32, count=len(trs))
+            >>> b = np.fromiter((t.b for t in trs), dtype=np.uint32, count=len(trs))
+            >>> for t, r in zip(trs, ((a + b) & mask).tolist()):
+            ...     t.result = r
+            >>> return trs
+        """
+        calc_exp = self.calc_exp
+        return [calc_exp(tr) for tr in trs]
@@ -9,7 +9,7 @@
 from __future__ import annotations
 
 import pyuvm
-from cocotb.triggers import NextTimeStep, ReadWrite
+from cocotb.triggers import ClockCycles, NextTimeStep, ReadWrite, Timer
 
 from . import utils_dv
 from .base_clock_mixin import BaseClockMixin
@@ -66,6 +66,8 @@ class BaseResetDriver(BaseClockMixin, pyuvm.uvm_component):
         self.reset_active_low: bool = True
         self.reset_cycles: int = 10
         self.reset_settle_cycles: int = 10
+        self._rst_active_val: int = 0
+        self._rst_inactive_val: int = 1
 
     def end_of_elaboration_phase(self) -> None:
         self.logger.debug("end_of_elaboration_phase begin")
@@ -115,6 +117,10 @@ class BaseResetDriver(BaseClockMixin, pyuvm.uvm_component):
             if self.reset_settle_cycles < 0:
                 raise ValueError("reset_settle_cycles must be >= 0")
 
+        # Plain ints: cocotb 2 writes them straight through the GPI integer path
+        self._rst_active_val = 0 if self.reset_active_low else 1
+        self._rst_inactive_val = 1 - self._rst_active_val
+
         self.logger.debug("_reset_pull_config end")
 
     async def run_phase(self) -> None:
@@ -124,31 +130,46 @@ class BaseResetDriver(BaseClockMixin, pyuvm.uvm_component):
         await self.pulse_reset()
         self.logger.debug("run_phase end")
 
+    async def _wait_drive_edges(self, n: int) -> None:
+        """Wait n drive edges: n base clock edges, then the post-edge skew.
+
+        Equivalent to n clock_drive_edge() calls while the skew is shorter than
+        a period; otherwise falls back to calling clock_drive_edge() n times.
+        """
+        if n <= 0:
+            return
+        delay_ps = 0 if self.drive_falling_edge else self._postedge_delay_ps
+        if self._clk is None or delay_ps >= self.clock_period_ps:
+            drive_edge = self.clock_drive_edge
+            for _ in range(n):
+                await drive_edge()
+            return
+        await ClockCycles(self._clk, n, rising=not self.drive_falling_edge)
+        if delay_ps > 0:
+            await Timer(delay_ps, unit="ps")
+
     async def pulse_reset(self) -> None:
         """Assert/deassert reset on the same drive edge as stimuli."""
 
         self.logger.debug("pulse_reset begin")
 
         rst = getattr(self._dut, self.reset_name)
-        active = 0 if self.reset_active_low else 1
-        inactive = 1 - active
+        wait_drive_edges = self._wait_drive_edges
 
         # Reference: SNUG 2016 "Applying Stimulus & Sampling Outputs." Assert reset at
         # time 0 using a non-blocking-style write and advance one delta cycle to avoid
         # races.
-        rst.value = active
+        rst.value = self._rst_active_val
         await ReadWrite()  # like an NBA at t=0
         await NextTimeStep()  # advance one delta to be extra-safe
 
         # Hold reset for exactly N drive edges (synchronous semantics)
-        for _ in range(max(0, self.reset_cycles)):
-            await self.clock_drive_edge()
+        await wait_drive_edges(self.reset_cycles)
 
         # Deassert reset at the drive edges (synchronous semantics)
-        rst.value = inactive
+        rst.value = self._rst_inactive_val
 
         # Allow M settle cycles, again in drive cadence
-        for _ in range(max(0, self.reset_settle_cycles)):
-            await self.clock_drive_edge()
+        await wait_drive_edges(self.reset_settle_cycles)
 
         self.logger.debug("pulse_reset end")
@@ -32,6 +32,8 @@ class BaseResetItem(BaseItem):
         >>> item.active = True  # For active-low reset, 0 means asserted
     """
 
+    __slots__ = ("value", "active")
+
     def __init__(self, name: str = "reset_tr") -> None:
         super().__init__(name)
         self.value: int | None = None
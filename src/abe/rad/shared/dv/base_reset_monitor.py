@@ -67,6 +67,10 @@ class BaseResetMonitor(
         self._dut: Any | None = None
         self._rst: SimHandleBase | None = None
         self._last_val: int | None = None
+        # Concrete item type after factory overrides, resolved once at EoE
+        self._item_cls: type[BaseResetItem] = BaseResetItem
+        # active state indexed by (level != 0); fixed after _reset_pull_config
+        self._active_lut: tuple[bool, bool] = (True, False)
 
     def end_of_elaboration_phase(self) -> None:
         self.logger.debug("end_of_elaboration_phase begin")
@@ -84,6 +88,7 @@ class BaseResetMonitor(
         v = utils_dv.uvm_config_db_get_try(self, "reset_active_low")
         if isinstance(v, bool):
             self.reset_active_low = v
+        self._active_lut = (True, False) if self.reset_active_low else (False, True)
         self.logger.debug("_reset_pull_config end")
 
     def _reset_bind_handles(self) -> None:
@@ -91,43 +96,59 @@ class BaseResetMonitor(
         self.logger.debug("_reset_bind_handles begin")
         self._dut = utils_dv.uvm_config_db_get(self, "dut")
         self._rst = utils_dv.get_signal(self._dut, self.reset_name)
+        probe = pyuvm.uvm_factory().create_object_by_type(BaseResetItem, name="probe")
+        self._item_cls = type(probe)
         self.logger.debug("_reset_bind_handles end")
 
     async def run_phase(self) -> None:
         self.logger.debug("run_phase begin")
 
-        assert self._rst is not None, "run_phase called before _reset_bind_handles"
-        reset_signal = getattr(self._dut, self.reset_name)
+        rst = self._rst
+        assert rst is not None, "run_phase called before _reset_bind_handles"
+        # Loop invariants bound once; triggers are reusable
+        read = utils_dv.get_signal_value_int
+        lut = self._active_lut
+        # The LUT stands in for calc_active unless a subclass overrides it
+        calc_active = (
+            None
+            if type(self).calc_active is BaseResetMonitor.calc_active
+            else self.calc_active
+        )
+        item_cls = self._item_cls
+        ap_write = self._ap_write
+        read_only = ReadOnly()
+        changed = rst.value_change
 
         # t=0
-        await ReadOnly()
-        val = utils_dv.get_signal_value_int(reset_signal.value)
+        await read_only
+        val = read(rst.value)
         if val is not None:
-            tr = pyuvm.uvm_factory().create_object_by_type(BaseResetItem, name="tr")
+            tr = item_cls("tr")
             tr.value = val
-            tr.active = self.calc_active(val)
-            self.ap.write(tr)
-            self.logger.debug(f"run_phase reset tr: {tr}")
+            tr.active = lut[val != 0] if calc_active is None else calc_active(val)
+            ap_write(tr)
+            self.logger.debug("run_phase reset tr: %s", tr)
             self._last_val = val
 
         # Reference: General UVM reset handling best practices—publish semantic reset
         # events (assert/deassert) rather than raw levels; downstream models use the
         # active boolean, making the bench polarity-neutral.
+        last_val = self._last_val
         while True:
-            await self._rst.value_change  # wake up only on reset change
-            await ReadOnly()  # sample after all drivers settle
-            val = utils_dv.get_signal_value_int(reset_signal.value)
-            if val is not None and val != self._last_val:
-                tr = pyuvm.uvm_factory().create_object_by_type(BaseResetItem, name="tr")
+            await changed  # wake up only on reset change
+            await read_only  # sample after all drivers settle
+            val = read(rst.value)
+            if val is not None and val != last_val:
+                tr = item_cls("tr")
                 tr.value = val
-                tr.active = self.calc_active(val)
-                self.ap.write(tr)
-                self.logger.debug(f"run_phase reset tr: {tr}")
-                self._last_val = val
+                tr.active = lut[val != 0] if calc_active is None else calc_active(val)
+                ap_write(tr)
+                self.logger.debug("run_phase reset tr: %s", tr)
+                self._last_val = last_val = val
 
     def calc_active(self, level: int) -> bool:
         """Level: 0/1; active_low chooses polarity."""
-        return (level == 0) if self.reset_active_low else (level != 0)
+        return self._active_lut[level != 0]
 
     async def sample_dut(self, dut: Any) -> BaseResetItem:
         """Return the next observed transaction (or None to skip)."""
@@ -8,7 +8,8 @@
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+import logging
+from typing import Callable, Generic, TypeVar
 
 import pyuvm
 
@@ -29,11 +30,14 @@ class BaseResetSink(pyuvm.uvm_subscriber, Generic[T]):
 
     Connected Components:
         drv (BaseDriver | None): Driver to notify of reset changes
+        drvs (list[BaseDriver]): Extra drivers sharing drv's reset domain
         sb_prd (BaseSbPredictor | None): Scoreboard predictor to notify
 
     The sink calls reset_change(value, active) on connected components,
     allowing them to respond appropriately (e.g., flushing state, resetting
-    reference models).
+    reference models). The targets are bound once at end_of_elaboration_phase,
+    so drv, drvs and sb_prd must be set by then (BaseEnv sets them in
+    connect_phase).
 
     Configuration:
         flush_after_deassert (int): Number of items to flush after reset
@@ -47,7 +51,8 @@ class BaseResetSink(pyuvm.uvm_subscriber, Generic[T]):
 
     Example:
         >>> # Typically created and connected by BaseEnv
-        >>> reset_sink.drv = agent.drv
+        >>> reset_sink.drv = agents[0].drv
+        >>> reset_sink.drvs = [agent.drv for agent in agents[1:]]
         >>> reset_sink.sb_prd = scoreboard.prd
         >>> mon_rst.ap.connect(reset_sink.analysis_export)
     """
@@ -56,15 +61,28 @@ class BaseResetSink(pyuvm.uvm_subscriber, Generic[T]):
         super().__init__(name, parent)
         utils_dv.configure_component_logger(self)
         self.drv: BaseDriver | None = None
+        self.drvs: list[BaseDriver] = []
         self.sb_prd: BaseSbPredictor | None = None
         self.flush_after_deassert: int = 0
+        self._sinks: list[Callable[[int, bool], None]] = []
+
+    def end_of_elaboration_phase(self) -> None:
+        self.logger.debug("end_of_elaboration_phase begin")
+        super().end_of_elaboration_phase()
+        drvs = [self.drv, *self.drvs] if self.drv is not None else self.drvs
+        self._sinks = [drv.reset_change for drv in drvs]
+        if self.sb_prd is not None:
+            self._sinks.append(self.sb_prd.reset_change)
+        self.logger.debug("end_of_elaboration_phase end")
 
     def write(self, tt: T) -> None:
-        self.logger.debug("write begin")
-        if tt.value is None or tt.active is None:
+        dbg = self.logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            self.logger.debug("write begin")
+        value, active = tt.value, tt.active
+        if value is None or active is None:
             return
-        if self.drv is not None:
-            self.drv.reset_change(tt.value, tt.active)
-        if self.sb_prd is not None:
-            self.sb_prd.reset_change(tt.value, tt.active)
-        self.logger.debug("write end")
+        for sink in self._sinks:
+            sink(value, active)
+        if dbg:
+            self.logger.debug("write end")
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Generic, TypeVar
 
 import pyuvm
@@ -18,7 +19,9 @@ from .base_item import BaseItem
 T = TypeVar("T", bound=BaseItem)
 
 
-class BaseSbComparator(pyuvm.uvm_component, Generic[T]):
+class BaseSbComparator(  # pylint: disable=too-many-instance-attributes
+    pyuvm.uvm_component, Generic[T]
+):
     """Scoreboard comparator using dual analysis FIFOs for expected and actual.
 
     This component compares expected transactions (from predictor) against
@@ -82,48 +85,63 @@ class BaseSbComparator(pyuvm.uvm_component, Generic[T]):
         q = utils_dv.uvm_config_db_get_try(self, "sb_error_quit_count")
         self.error_quit_count: int = int(q) if isinstance(q, int) and q >= 0 else 1
 
+        self._initial_flush_num: int = 0
+        n = utils_dv.uvm_config_db_get_try(self, "sb_initial_flush_num")
+        if n is not None and not isinstance(n, int):
+            self.logger.warning(
+                "sb_initial_flush_num should be int, got %r; using 0", n
+            )
+        elif isinstance(n, int):
+            self._initial_flush_num = max(0, n)
+
     # No connect_phase() needed
 
+    @staticmethod
+    async def _fifo_get(fifo: pyuvm.uvm_tlm_analysis_fifo[T]) -> T:
+        """Take the next item, without the blocking get() when one is ready.
+
+        pyuvm's blocking get() formats the item for its FIFO debug log on
+        every call; try_get() does not, so queued items skip that work.
+        """
+        ok, item = fifo.try_get()
+        if ok and item is not None:
+            return item
+        return await fifo.get()
+
     async def run_phase(self) -> None:
         self.logger.debug("run_phase begin")
 
         # Initial flush to drain pipeline bubbles if requested
 
-        initial_flush_num = 0
-        n = utils_dv.uvm_config_db_get_try(self, "sb_initial_flush_num")
-        if n is not None and not isinstance(n, int):
-            self.logger.warning(
-                "sb_initial_flush_num should be int, got %r; using 0", n
-            )
-        elif isinstance(n, int):
-            initial_flush_num = max(0, n)
+        fifo_get = self._fifo_get
+        exp_fifo = self.exp_fifo
+        out_fifo = self.out_fifo
+        logger = self.logger
+        is_enabled_for = logger.isEnabledFor
 
-        for f in range(initial_flush_num):
-            exp: T = await self.exp_fifo.get()
-            act: T = await self.out_fifo.get()
-            self.logger.debug(
-                "Initial flush %d: exp=%s act=%s", f, exp.to_dict(), act.to_dict()
-            )
+        for f in range(self._initial_flush_num):
+            exp: T = await fifo_get(exp_fifo)
+            act: T = await fifo_get(out_fifo)
+            logger.debug("Initial flush %d: exp=%s act=%s", f, exp, act)
 
         # Compare stream forever
 
         while True:
-            exp = await self.exp_fifo.get()
-            act = await self.out_fifo.get()
+            exp = await fifo_get(exp_fifo)
+            act = await fifo_get(out_fifo)
             self.vect_cnt += 1
             if act.compare_out(exp):
                 self.pass_cnt += 1
-                self.logger.debug(
-                    "PASS exp=%s act=%s vect_cnt=%s",
-                    exp.to_dict(),
-                    act.to_dict(),
-                    self.vect_cnt,
-                )
-            else:
-                self.err_cnt += 1
-                self.logger.error(
-                    "MISMATCH exp=%s act=%s", exp.to_dict(), act.to_dict()
-                )
+                if is_enabled_for(logging.DEBUG):
+                    logger.debug(
+                        "PASS exp=%s act=%s vect_cnt=%s",
+                        exp,
+                        act,
+                        self.vect_cnt,
+                    )
+                continue
+            self.err_cnt += 1
+            logger.error("MISMATCH exp=%s act=%s", exp, act)
             if (
                 self.fail_on_error
                 and self.error_quit_count
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Generic, TypeVar
 
 import pyuvm
@@ -72,17 +73,21 @@ class BaseSbPredictor(pyuvm.uvm_subscriber, Generic[T]):
 
     def reset_change(self, value: int, active: bool) -> None:
         """Apply reset to reference model."""
-        self.logger.debug("reset_change begin")
+        dbg = self.logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            self.logger.debug("reset_change begin")
         self.ref_model.reset_change(value, active)
-        self.logger.debug(f"reset_change end: value={value} active={active}")
+        if dbg:
+            self.logger.debug("reset_change end: value=%d active=%s", value, active)
 
     def write(self, tt: T) -> None:
         """
         - Receives sampled transactions (type T)
-        - Makes a clone to keep broadcast transactions immutable (0-time discipline)
+        - Makes a clone to keep broadcast transactions immutable (0-time discipline),
+          unless the ref model declares mutates_input = False
         - Uses a DUT-specific BaseRefModel[T] to compute expected
         - Publishes expected on results_ap
         """
-        exp = tt.clone()
-        exp = self.ref_model.calc_exp(exp)
+        ref_model = self.ref_model
+        exp = ref_model.calc_exp(tt.clone() if ref_model.mutates_input else tt)
         self.results_ap.write(exp)
@@ -9,7 +9,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Generic, Type, TypeVar, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Mapping,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 import pyuvm
 
@@ -30,7 +39,8 @@ class BaseSequence(pyuvm.uvm_sequence, Generic[T]):
     Execution Flow:
         1. body_pre() - Optional pre-sequence hook
         2. For each item (seq_len times):
-           a. make_item(index) - Create transaction
+           a. make_item(index) - Create transaction (unless overridden, all
+              items are constructed up front before the loop)
            b. start_item(item) - Acquire sequencer grant
            c. set_item_inputs(item, index) - Randomize/configure (must implement)
            d. finish_item(item) - Send to driver and release grant
@@ -42,6 +52,9 @@ class BaseSequence(pyuvm.uvm_sequence, Generic[T]):
     Optional hooks:
         body_pre(): Called before generating items
         body_post(): Called after all items generated
+        vectorize_inputs(n): Generate all n items' input fields in one call
+            (e.g. with NumPy); body() then assigns them per item, and
+            set_item_inputs becomes optional (called afterwards if defined)
 
     Attributes:
         seq_len (int): Number of items to generate (default: 100)
@@ -49,9 +62,9 @@ class BaseSequence(pyuvm.uvm_sequence, Generic[T]):
         logger: Logger for debug output
 
     Factory Optimization:
-        The sequence determines the concrete item type from factory overrides
-        once during body() and caches the constructor for efficient item creation
-        in the hot path.
+        The sequence looks up the concrete item type from factory overrides
+        once during body() (no probe object is created) and caches the
+        constructor for efficient item creation in the hot path.
 
     Note:
         pyuvm attaches methods dynamically. This class provides type hints and
@@ -73,6 +86,8 @@ class BaseSequence(pyuvm.uvm_sequence, Generic[T]):
         super().__init__(name)
         self.logger: logging.Logger = logging.getLogger(f"uvm.{name}")
         utils_dv.configure_non_component_logger(self.logger)
+        # Level is fixed by configure_non_component_logger; check it once
+        self._dbg: bool = self.logger.isEnabledFor(logging.DEBUG)
         self.sequencer: BaseSequencer  # pyuvm sets this at runtime on start()
         self._item_class_constructor: Type[T] | None = None
         self.seq_len: int = max(1, int(seq_len))
@@ -80,30 +95,49 @@ class BaseSequence(pyuvm.uvm_sequence, Generic[T]):
 
     async def body(self) -> None:
         """UVM flow: start_item -> set_item_inputs -> finish_item, in a fixed loop."""
-        self.logger.debug("BaseSequence body begin: length = %d", self.seq_len)
+        if self._dbg:
+            self.logger.debug("BaseSequence body begin: length = %d", self.seq_len)
         # Hook for subclasses
         await self.body_pre()
         # Ask the factory what BaseItem ultimately resolves to (after overrides).
-        probe = pyuvm.uvm_factory().create_object_by_type(
-            BaseItem, name="probe_for_type"
-        )
-        # Cache the concrete constructor for the hot path.
-        self._item_class_constructor = cast(Type[T], type(probe))
+        # This is the lookup create_object_by_type does, without building and
+        # discarding a probe item; None (bad override) falls back in make_item.
+        item_cls = pyuvm.uvm_factory().find_override_by_type(BaseItem, "probe_for_type")
+        # Cache the concrete constructor for the hot path. The override is a
+        # BaseItem subclass standing in for T; no runtime cast() needed.
+        self._item_class_constructor = item_cls  # type: ignore[assignment]
         # Store handles for hot path
-        make = self.make_item
-        set_inputs = self.set_item_inputs
-        # Send the items
-        for i in range(self.seq_len):
-            item = make(i)
-            await self.start_item(item)
-            await set_inputs(item, i)
-            await self.finish_item(item)
+        set_inputs = self._vectorized_setter() or self.set_item_inputs
+        start_item = self.start_item
+        finish_item = self.finish_item
+        ctor = self._item_class_constructor
+        if ctor is None or type(self).make_item is not BaseSequence.make_item:
+            # Fallback or a subclass make_item: keep going through make_item
+            make = self.make_item
+            for i in range(self.seq_len):
+                item = make(i)
+                await start_item(item)
+                await set_inputs(item, i)
+                await finish_item(item)
+        else:
+            # Stock make_item: build every item up front in one comprehension,
+            # then only awaits remain per item. Items keep unique names for
+            # debug; an f-string is the cheapest way to build them on CPython
+            # 3.11+ (faster than %-format or a separate name list).
+            items = [ctor(f"tr{i}") for i in range(self.seq_len)]
+            for i, item in enumerate(items):
+                await start_item(item)
+                await set_inputs(item, i)
+                await finish_item(item)
         # Hook for subclasses
         await self.body_post()
-        self.logger.debug("BaseSequence body end")
+        if self._dbg:
+            self.logger.debug("BaseSequence body end")
 
     async def body_pre(self) -> None:
         """Placeholder."""
+        if not self._dbg:
+            return
         self.logger.debug("BaseSequence body_pre begin")
         self.logger.debug("BaseSequence body_pre end")
 
@@ -112,14 +146,63 @@ class BaseSequence(pyuvm.uvm_sequence, Generic[T]):
         if self._item_class_constructor is None:
             # Should not happen; keep a safe fallback.
             create = pyuvm.uvm_factory().create_object_by_type
-            return cast(T, create(BaseItem, name=f"tr{index}"))
+            return create(BaseItem, name=f"tr{index}")  # type: ignore[return-value]
         return self._item_class_constructor(f"tr{index}")
 
     async def set_item_inputs(self, item: T, index: int) -> None:
         """Must be implemented in subclasses: randomize/tweak before finish_item."""
         raise NotImplementedError
 
+    def vectorize_inputs(
+        self, n: int  # pylint: disable=unused-argument
+    ) -> Mapping[str, Sequence[Any]]:
+        """Optional: return {field: n values} for all items in one call.
+
+        Override to generate inputs in bulk, e.g. with NumPy:
+
+            >>> def vectorize_inputs(self, n):
+            ...     rng = np.random.default_rng()
+            ...     return {
+            ...         "addr": np.arange(n, dtype=np.uint32) & 0xFF,
+            ...         "data": rng.integers(0, 256, n),
+            ...     }
+
+        Arrays are converted with tolist() once, so items get plain ints.
+        The base returns no columns and is skipped by body().
+        """
+        return {}
+
+    def _vectorized_setter(self) -> Callable[[T, int], Awaitable[None]] | None:
+        """Bulk-generate inputs via vectorize_inputs() if a subclass defines it."""
+        cls = type(self)
+        if cls.vectorize_inputs is BaseSequence.vectorize_inputs:
+            return None
+        n = self.seq_len
+        cols: list[tuple[str, list[Any]]] = []
+        for name, values in self.vectorize_inputs(n).items():
+            col = values.tolist() if hasattr(values, "tolist") else list(values)
+            if len(col) < n:
+                raise ValueError(
+                    f"vectorize_inputs: {name!r} has {len(col)} values, need {n}"
+                )
+            cols.append((name, col))
+        tweak = (
+            None
+            if cls.set_item_inputs is BaseSequence.set_item_inputs
+            else self.set_item_inputs
+        )
+
+        async def set_inputs(item: T, index: int) -> None:
+            for name, col in cols:
+                setattr(item, name, col[index])
+            if tweak is not None:
+                await tweak(item, index)
+
+        return set_inputs
+
     async def body_post(self) -> None:
         """Placeholder."""
+        if not self._dbg:
+            return
         self.logger.debug("BaseSequence body_post begin")
         self.logger.debug("BaseSequence body_post end")
@@ -87,6 +87,14 @@ class BaseTest(pyuvm.uvm_test):
         self.clock_driver: BaseClockDriver
         self.reset_driver: BaseResetDriver
         self.env: BaseEnv
+        self._cfg: utils_cli.BenchSettings | None = None
+
+    @property
+    def settings(self) -> utils_cli.BenchSettings:
+        """Bench settings from env/plusargs, resolved once on first use."""
+        if self._cfg is None:
+            self._cfg = utils_cli.load_bench_settings()
+        return self._cfg
 
     def build_phase(self) -> None:
         self.logger.debug("build_phase begin")
@@ -137,7 +145,7 @@ class BaseTest(pyuvm.uvm_test):
 
     def build_config(self) -> None:
         """Get and set testbench config properties."""
-        drain_time_ps = utils_cli.get_int_setting("DRAIN_TIME_PS", 10_000)
+        drain_time_ps = self.settings.drain_time_ps
         if drain_time_ps > 0:
             utils_dv.uvm_config_db_set(self, "", "drain_time_ps", drain_time_ps)
             utils_dv.uvm_config_db_set(self, "*", "drain_time_ps", drain_time_ps)
@@ -149,21 +157,21 @@ class BaseTest(pyuvm.uvm_test):
         clock or needs non-default configuration properties, override this method.
         Bench-level defaults are placed under *. Override as needed.
         """
-        clock_enable = utils_cli.get_bool_setting("CLOCK_ENABLE", True)
-        clock_name = utils_cli.get_str_setting("CLOCK_NAME", "clk")
-        clock_period_ps = utils_cli.get_int_setting("CLOCK_PERIOD_PS", 1_000)
-        clock_start_high = utils_cli.get_bool_setting("CLOCK_START_HIGH", False)
-        clock_init_delay_ps = utils_cli.get_int_setting("CLOCK_INIT_DELAY_PS", 0)
-
-        utils_dv.uvm_config_db_set(self, "*", "clock_enable", clock_enable)
-        utils_dv.uvm_config_db_set(self, "*", "clock_name", clock_name)
-        utils_dv.uvm_config_db_set(self, "*", "clock_period_ps", clock_period_ps)
-        utils_dv.uvm_config_db_set(self, "*", "clock_start_high", clock_start_high)
-        utils_dv.uvm_config_db_set(
-            self, "*", "clock_init_delay_ps", clock_init_delay_ps
+        cfg = self.settings
+        utils_dv.uvm_config_db_set_many(
+            self,
+            "*",
+            {
+                "clock_enable": cfg.clock_enable,
+                "clock_name": cfg.clock_name,
+                "clock_period_ps": cfg.clock_period_ps,
+                "clock_start_high": cfg.clock_start_high,
+                "clock_init_delay_ps": cfg.clock_init_delay_ps,
+            },
         )
 
-        self.clock_driver = pyuvm.uvm_factory().create_component_by_type(
+        factory = pyuvm.uvm_factory()
+        self.clock_driver = factory.create_component_by_type(
             BaseClockDriver,
             parent_inst_path=self.get_full_name(),
             name="clock_driver",
@@ -177,21 +185,21 @@ class BaseTest(pyuvm.uvm_test):
         non-default configuration properties, override this method. Bench-level defaults
         are placed under *. Override as needed.
         """
-        reset_enable = utils_cli.get_bool_setting("RESET_ENABLE", True)
-        reset_name = utils_cli.get_str_setting("RESET_NAME", "rst_n")
-        reset_active_low = utils_cli.get_bool_setting("RESET_ACTIVE_LOW", True)
-        reset_cycles = utils_cli.get_int_setting("RESET_CYCLES", 10)
-        reset_settle_cycles = utils_cli.get_int_setting("RESET_SETTLE_CYCLES", 10)
-
-        utils_dv.uvm_config_db_set(self, "*", "reset_enable", reset_enable)
-        utils_dv.uvm_config_db_set(self, "*", "reset_name", reset_name)
-        utils_dv.uvm_config_db_set(self, "*", "reset_active_low", reset_active_low)
-        utils_dv.uvm_config_db_set(self, "*", "reset_cycles", reset_cycles)
-        utils_dv.uvm_config_db_set(
-            self, "*", "reset_settle_cycles", reset_settle_cycles
+        cfg = self.settings
+        utils_dv.uvm_config_db_set_many(
+            self,
+            "*",
+            {
+                "reset_enable": cfg.reset_enable,
+                "reset_name": cfg.reset_name,
+                "reset_active_low": cfg.reset_active_low,
+                "reset_cycles": cfg.reset_cycles,
+                "reset_settle_cycles": cfg.reset_settle_cycles,
+            },
         )
 
-        self.reset_driver = pyuvm.uvm_factory().create_component_by_type(
+        factory = pyuvm.uvm_factory()
+        self.reset_driver = factory.create_component_by_type(
             BaseResetDriver,
             parent_inst_path=self.get_full_name(),
             name="reset_driver",
@@ -204,23 +212,21 @@ class BaseTest(pyuvm.uvm_test):
         environment or needs non-default configuration properties, override this
         method. Bench-level defaults are placed under *. Override as needed.
         """
-        check_en = utils_cli.get_bool_setting("CHECK_EN", True)
-        coverage_en = utils_cli.get_bool_setting("COVERAGE_EN", True)
-        sb_fail_on_error = utils_cli.get_bool_setting("SB_FAIL_ON_ERROR", True)
-        sb_error_quit_count = utils_cli.get_int_setting("SB_ERROR_QUIT_COUNT", 1)
-        sb_initial_flush_num = utils_cli.get_int_setting("SB_INITIAL_FLUSH_NUM", 0)
-
-        utils_dv.uvm_config_db_set(self, "env*", "check_en", check_en)
-        utils_dv.uvm_config_db_set(self, "env*", "coverage_en", coverage_en)
-        utils_dv.uvm_config_db_set(
-            self, "env*", "sb_initial_flush_num", sb_initial_flush_num
-        )
-        utils_dv.uvm_config_db_set(self, "env*", "sb_fail_on_error", sb_fail_on_error)
-        utils_dv.uvm_config_db_set(
-            self, "env*", "sb_error_quit_count", sb_error_quit_count
+        cfg = self.settings
+        utils_dv.uvm_config_db_set_many(
+            self,
+            "env*",
+            {
+                "check_en": cfg.check_en,
+                "coverage_en": cfg.coverage_en,
+                "sb_initial_flush_num": cfg.sb_initial_flush_num,
+                "sb_fail_on_error": cfg.sb_fail_on_error,
+                "sb_error_quit_count": cfg.sb_error_quit_count,
+            },
         )
 
-        self.env = pyuvm.uvm_factory().create_component_by_type(
+        factory = pyuvm.uvm_factory()
+        self.env = factory.create_component_by_type(
             BaseEnv, parent_inst_path=self.get_full_name(), name="env", parent=self
         )
 
@@ -244,7 +250,10 @@ class BaseTest(pyuvm.uvm_test):
         have a consistent methodology regardless of the number of clocks.
         """
 
-        self.logger.debug("drain begin")
+        # Checked here, not in __init__: levels are set at end_of_elaboration
+        dbg = self.logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            self.logger.debug("drain begin")
 
         dt = utils_dv.uvm_config_db_get_try(self, "drain_time_ps")
 
@@ -253,8 +262,12 @@ class BaseTest(pyuvm.uvm_test):
 
         if time_ps is not None:
             n = max(0, int(time_ps))
-            self.logger.debug("drain: %s ps begin", format(n, "_d"))
+            if dbg:
+                n_fmt = format(n, "_d")
+                self.logger.debug("drain: %s ps begin", n_fmt)
             await Timer(n, unit="ps")
-            self.logger.debug("drain: %s ps end", format(n, "_d"))
+            if dbg:
+                self.logger.debug("drain: %s ps end", n_fmt)
 
-        self.logger.debug("drain end")
+        if dbg:
+            self.logger.debug("drain end")
@@ -21,6 +21,7 @@ Functions:
     get_int_setting: Resolve integer configuration (supports hex with 0x)
     apply_factory_overrides_from_plusargs: Apply UVM factory overrides from CLI
     iter_plusargs: Iterate over all plusargs
+    load_bench_settings: Resolve all BaseTest bench settings once (BenchSettings)
 
 Plusargs Format:
     Boolean flags: +NAME (treated as True) or +NAME=1/0/true/false/yes/no
@@ -50,12 +51,30 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Tuple
 
 import pyuvm
 
 _TRUE_SET = {"1", "true", "yes", "y", "on"}
 _FALSE_SET = {"0", "false", "no", "n", "off"}
+# One lookup resolves either spelling set
+_BOOL_MAP: dict[str, bool] = {
+    **dict.fromkeys(_TRUE_SET, True),
+    **dict.fromkeys(_FALSE_SET, False),
+}
+
+# Env vars holding plusargs, in precedence order
+_PLUSARGS_ENV_KEYS = ("PLUSARGS", "COCOTB_PLUSARGS", "RAD_PLUSARGS")
+
+# +uvm_set_<kind>_override=req,over[,replace|path]; matched whole-token once.
+# Tokens come from str.split(), so fields carry no surrounding whitespace.
+_OVERRIDE_RE = re.compile(
+    r"\+uvm_set_(type|inst)_override=([^,]*),([^,]*)(?:,([^,]*))?"
+)
+_OVERRIDE_KIND_RE = re.compile(r"\+uvm_set_(type|inst)_override=")
 
 # pyuvm typically throws lookup/value/type errors on bad overrides
 _FACTORY_EXC: Tuple[type[BaseException], ...] = (KeyError, ValueError, TypeError)
@@ -63,12 +82,45 @@ _FACTORY_EXC: Tuple[type[BaseException], ...] = (KeyError, ValueError, TypeError
 
 def _parse_bool(s: str) -> bool | None:
     """Convert str to bool."""
-    v = s.strip().lower()
-    if v in _TRUE_SET:
-        return True
-    if v in _FALSE_SET:
-        return False
-    return None
+    return _BOOL_MAP.get(s.strip().lower())
+
+
+def _plusargs_str() -> str:
+    """Return the raw plusargs string from the first non-empty env var."""
+    environ = os.environ
+    for key in _PLUSARGS_ENV_KEYS:
+        v = environ.get(key)
+        if v:
+            return v
+    return ""
+
+
+@lru_cache(maxsize=8)
+def _plusarg_tokens(plusargs: str) -> tuple[str, ...]:
+    """Split a plusargs string (cached per distinct string)."""
+    return tuple(plusargs.split())
+
+
+@lru_cache(maxsize=8)
+def _plusarg_map(plusargs: str) -> dict[str, str]:
+    """Map NAME -> value for each +NAME[=val] token; first occurrence wins.
+
+    Cached per distinct plusargs string, so a changed env var is picked up
+    without explicit invalidation. Callers must not mutate the result.
+    """
+    m: dict[str, str] = {}
+    for tok in _plusarg_tokens(plusargs):
+        if tok.startswith("+"):
+            name, sep, val = tok[1:].partition("=")
+            # Interpret a bare flag as enabled/true
+            m.setdefault(name, val if sep else "1")
+    return m
+
+
+@lru_cache(maxsize=None)
+def _env_keys(name: str) -> tuple[str, str]:
+    """Env var names checked for a setting: NAME, then RAD_NAME (built once)."""
+    return (name, f"RAD_{name}")
 
 
 def _get_plusarg(name: str) -> str | None:
@@ -76,31 +128,15 @@ def _get_plusarg(name: str) -> str | None:
     - If found as '+NAME=val', returns 'val'
     - If found as bare '+NAME', returns '1' (treat like a true/enable flag)
     """
-    plusargs = (
-        os.environ.get("PLUSARGS", "")
-        or os.environ.get("COCOTB_PLUSARGS", "")
-        or os.environ.get("RAD_PLUSARGS", "")
-    )
+    plusargs = _plusargs_str()
     if not plusargs:
         return None
-    prefix = f"+{name}="
-    for tok in plusargs.split():
-        if tok.startswith(prefix):
-            return tok[len(prefix) :]
-        if tok == f"+{name}":
-            # Interpret a bare flag as enabled/true
-            return "1"
-    return None
+    return _plusarg_map(plusargs).get(name)
 
 
 def iter_plusargs() -> Iterable[str]:
     """Yield +args from common env vars (same precedence you used in BaseTest)."""
-    s = (
-        os.environ.get("PLUSARGS", "")
-        or os.environ.get("COCOTB_PLUSARGS", "")
-        or os.environ.get("RAD_PLUSARGS", "")
-    )
-    return s.split()
+    return _plusarg_tokens(_plusargs_str())
 
 
 def get_bool_setting(name: str, default: bool) -> bool:
@@ -108,7 +144,7 @@ def get_bool_setting(name: str, default: bool) -> bool:
     Resolve a boolean setting with precedence: env > plusarg > default.
     bare +NAME is treated as True
     """
-    for key in (name, f"RAD_{name}"):
+    for key in _env_keys(name):
         v = os.environ.get(key)
         if v is not None:
             parsed = _parse_bool(v)
@@ -124,7 +160,7 @@ def get_bool_setting(name: str, default: bool) -> bool:
 
 def get_str_setting(name: str, default: str) -> str:
     """Resolve a string setting: env > plusarg > default (always returns str)."""
-    for key in (name, f"RAD_{name}"):
+    for key in _env_keys(name):
         v = os.environ.get(key)
         if v is not None:
             return v
@@ -134,7 +170,7 @@ def get_str_setting(name: str, default: str) -> str:
 
 def get_int_setting(name: str, default: int) -> int:
     """Resolve an int setting: env > plusarg > default (always returns int)."""
-    for key in (name, f"RAD_{name}"):
+    for key in _env_keys(name):
         v = os.environ.get(key)
         if v is not None:
             try:
@@ -161,14 +197,18 @@ def apply_factory_overrides_from_plusargs(logger: logging.Logger | None = None)
     f = pyuvm.uvm_factory()
 
     for tok in iter_plusargs():
-        if tok.startswith("+uvm_set_type_override="):
-            body = tok.split("=", 1)[1]
-            parts = [p.strip() for p in body.split(",")]
-            if len(parts) not in (2, 3):
-                log.warning("Bad +uvm_set_type_override: %s", tok)
-                continue
-            req, over = parts[0], parts[1]
-            replace = True if len(parts) == 2 else (parts[2] != "0")
+        if not tok.startswith("+uvm_set_"):
+            continue
+        m = _OVERRIDE_RE.fullmatch(tok)
+        if m is None:
+            kind_m = _OVERRIDE_KIND_RE.match(tok)
+            if kind_m is not None:
+                log.warning("Bad +uvm_set_%s_override: %s", kind_m.group(1), tok)
+            continue
+        kind, req, over, extra = m.groups()
+
+        if kind == "type":
+            replace = extra is None or extra != "0"
             try:
                 f.set_type_override_by_name(req, over, replace=replace)
                 log.debug(
@@ -177,15 +217,57 @@ def apply_factory_overrides_from_plusargs(logger: logging.Logger | None = None)
             except _FACTORY_EXC as e:  # pragma: no cover
                 log.warning("Override failed (%s): %s", tok, e)
 
-        elif tok.startswith("+uvm_set_inst_override="):
-            body = tok.split("=", 1)[1]
-            parts = [p.strip() for p in body.split(",")]
-            if len(parts) != 3:
-                log.warning("Bad +uvm_set_inst_override: %s", tok)
-                continue
-            req, over, path = parts
+        elif extra is None:
+            log.warning("Bad +uvm_set_inst_override: %s", tok)
+
+        else:
             try:
-                f.set_inst_override_by_name(req, over, path)
-                log.debug("Factory: inst override %s @ %s -> %s", req, path, over)
+                f.set_inst_override_by_name(req, over, extra)
+                log.debug("Factory: inst override %s @ %s -> %s", req, extra, over)
             except _FACTORY_EXC as e:  # pragma: no cover
                 log.warning("Override failed (%s): %s", tok, e)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchSettings:  # pylint: disable=too-many-instance-attributes
+    """Bench-level settings used by BaseTest, resolved in one pass."""
+
+    drain_time_ps: int
+    clock_enable: bool
+    clock_name: str
+    clock_period_ps: int
+    clock_start_high: bool
+    clock_init_delay_ps: int
+    reset_enable: bool
+    reset_name: str
+    reset_active_low: bool
+    reset_cycles: int
+    reset_settle_cycles: int
+    check_en: bool
+    coverage_en: bool
+    sb_fail_on_error: bool
+    sb_error_quit_count: int
+    sb_initial_flush_num: int
+
+
+def load_bench_settings() -> BenchSettings:
+    """Resolve every BenchSettings field (env > plusarg > default) once."""
+    b, s, i = get_bool_setting, get_str_setting, get_int_setting
+    return BenchSettings(
+        drain_time_ps=i("DRAIN_TIME_PS", 10_000),
+        clock_enable=b("CLOCK_ENABLE", True),
+        clock_name=s("CLOCK_NAME", "clk"),
+        clock_period_ps=i("CLOCK_PERIOD_PS", 1_000),
+        clock_start_high=b("CLOCK_START_HIGH", False),
+        clock_init_delay_ps=i("CLOCK_INIT_DELAY_PS", 0),
+        reset_enable=b("RESET_ENABLE", True),
+        reset_name=s("RESET_NAME", "rst_n"),
+        reset_active_low=b("RESET_ACTIVE_LOW", True),
+        reset_cycles=i("RESET_CYCLES", 10),
+        reset_settle_cycles=i("RESET_SETTLE_CYCLES", 10),
+        check_en=b("CHECK_EN", True),
+        coverage_en=b("COVERAGE_EN", True),
+        sb_fail_on_error=b("SB_FAIL_ON_ERROR", True),
+        sb_error_quit_count=i("SB_ERROR_QUIT_COUNT", 1),
+        sb_initial_flush_num=i("SB_INITIAL_FLUSH_NUM", 0),
+    )
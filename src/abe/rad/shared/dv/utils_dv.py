@@ -22,7 +22,9 @@ Functions:
         uvm_config_db(): Return cached config DB instance
         uvm_config_db_get_try(): Get config value or None if missing
         uvm_config_db_get(): Get config value or raise ConfigKeyError
+        uvm_config_db_get_typed(): Get config value if it has the expected type
         uvm_config_db_set(): Set config value
+        uvm_config_db_set_many(): Set several values under one scope
 
     Signal Access:
         get_signal(): Get signal handle from DUT with validation
@@ -57,8 +59,10 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
+import weakref
 from functools import lru_cache
-from typing import Any, Protocol, TypeVar, Union, cast
+from typing import Any, Callable, Mapping, Protocol, TypeVar, Union, cast
 
 import pyuvm
 from cocotb.handle import SimHandleBase
@@ -81,8 +85,9 @@ class HasValue(Protocol):  # pylint: disable=too-few-public-methods
         """The value."""
 
 
+@lru_cache(maxsize=4)
 def desired_log_level(default: int = logging.INFO) -> int:
-    """Return desired log level from env vars or default."""
+    """Return desired log level from env vars or default (cached per process)."""
     name = (os.getenv("COCOTB_LOG_LEVEL") or "INFO").upper()
     return getattr(logging, name, default)
 
@@ -107,6 +112,13 @@ def uvm_config_db() -> Any:
     return getattr(pyuvm, "uvm_config_db")()
 
 
+@lru_cache(maxsize=1)
+def _cfg_db_methods() -> tuple[Callable[..., Any], Callable[..., None]]:
+    """Bound get/set of the cached config DB, resolved once."""
+    db = uvm_config_db()
+    return db.get, db.set
+
+
 def uvm_config_db_get_try(
     comp: pyuvm.uvm_component, key: str, inst: str = ""
 ) -> Any | None:
@@ -115,7 +127,7 @@ def uvm_config_db_get_try(
     if inst == "*":
         inst = ""
     try:
-        return cast(Any, uvm_config_db().get(comp, inst, key))
+        return _cfg_db_methods()[0](comp, inst, sys.intern(key))
     except error_classes.UVMConfigItemNotFound:
         return None
 
@@ -131,11 +143,40 @@ def uvm_config_db_get(comp: pyuvm.uvm_component, key: str) -> object:
     )
 
 
+def uvm_config_db_get_typed(
+    comp: pyuvm.uvm_component, key: str, tp: type[T], default: T
+) -> T:
+    """Return value if present and an instance of tp, else default.
+    Missing keys and wrong-typed values both fall back to default."""
+    val = uvm_config_db_get_try(comp, key)
+    return val if isinstance(val, tp) else default
+
+
 def uvm_config_db_set(
     ctx: pyuvm.uvm_component | None, inst_name: str, key: str, value: Any
 ) -> None:
-    """Set a key in the config DB (inst_name like '' or '*' etc.)."""
-    uvm_config_db().set(ctx, inst_name, key, value)
+    """Set a key in the config DB (inst_name like '' or '*' etc.).
+
+    The key is interned (as get does), so keys built at runtime still hit
+    pyuvm's dict lookups by identity, like literal keys.
+    """
+    _cfg_db_methods()[1](ctx, inst_name, sys.intern(key), value)
+
+
+def uvm_config_db_set_many(
+    ctx: pyuvm.uvm_component | None, inst_name: str, kv: Mapping[str, Any]
+) -> None:
+    """Set every key/value in kv under the same scope, in order."""
+    set_cfg = _cfg_db_methods()[1]
+    intern = sys.intern
+    for key, value in kv.items():
+        set_cfg(ctx, inst_name, intern(key), value)
+
+
+# Validated handles per DUT object; an entry goes away with its DUT
+_SIGNAL_CACHE: weakref.WeakKeyDictionary[Any, dict[str, SimHandleBase]] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def get_signal(dut: Any, signal_name: str) -> SimHandleBase:
@@ -143,21 +184,36 @@ def get_signal(dut: Any, signal_name: str) -> SimHandleBase:
 
     Returns a SimHandleBase (cocotb signal handle) that has .value property.
     Raises RuntimeError if signal not found, TypeError if signal has no .value.
+    Validated handles are cached per DUT, so repeat lookups are dict hits.
     """
+    try:
+        return _SIGNAL_CACHE[dut][signal_name]
+    except (KeyError, TypeError):
+        pass
     signal = getattr(dut, signal_name, None)
     if signal is None:
         raise RuntimeError(f"Signal '{signal_name}' not found on DUT")
-    if not hasattr(signal, "value"):
+    # Check the class first: hasattr() on a handle runs the .value getter,
+    # which reads the signal through the simulator
+    if not (hasattr(type(signal), "value") or hasattr(signal, "value")):
         raise TypeError(f"Signal '{signal_name}' has no .value property")
+    try:
+        _SIGNAL_CACHE.setdefault(dut, {})[signal_name] = signal
+    except TypeError:
+        pass  # DUT stand-ins that cannot be weakly referenced are not cached
     return cast(SimHandleBase, signal)
 
 
 def get_signal_value_int(sig: Union[Logic, LogicArray]) -> int | None:
-    """Return integer value if resolvable (no X/Z), else None."""
-    if isinstance(sig, Logic):
-        # cocotb.Logic supports int() conversion at runtime
-        return (
-            int(sig) if sig.is_resolvable else None
-        )  # pyright: ignore[reportArgumentType]
-    # LogicArray
-    return sig.to_unsigned() if sig.is_resolvable else None
+    """Return integer value if resolvable (no X/Z), else None.
+
+    Converts first and maps ValueError (X/Z present) to None: is_resolvable
+    walks every bit of a LogicArray, costing more than the conversion.
+    """
+    try:
+        if isinstance(sig, Logic):
+            # cocotb.Logic supports int() conversion at runtime
+            return int(sig)  # pyright: ignore[reportArgumentType]
+        return sig.to_unsigned()  # LogicArray
+    except ValueError:
+        return None
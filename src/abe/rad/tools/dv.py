@@ -4,6 +4,8 @@
 
 # This file: src/abe/rad/tools/dv.py
 
+# pylint: disable=too-many-lines
+
 """Run UVM testbenches via cocotb, pyuvm, and pytest.
 
 This module provides a framework for building and testing HDL designs using:
@@ -27,25 +29,37 @@ Typical usage:
 
     # Generate N random seeds
     dv --design=rad_async_fifo --test=rad_async_fifo_env --nseeds=10
+
+    # Run the seeds on 4 worker processes
+    dv --design=rad_async_fifo --test=rad_async_fifo_env --nseeds=10 --jobs=4
+
+    # Run the second of 4 disjoint slices of the seeds (e.g. on one CI machine)
+    dv --design=rad_async_fifo --test=rad_async_fifo_env --nseeds=100 \
+        --num-shards=4 --shard-id=1
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import hashlib
 import json
 import logging
 import os
 import random
 import shlex
+import string
 import sys
+import tempfile
 import time
+import traceback
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Final, Sequence
-
-import pytest
-from cocotb_tools.runner import get_runner
+from typing import Any, Final, Iterator, Mapping, Sequence
 
 # If executed as a script (path mode), __package__ is empty/None and __spec__ is None.
 if (__package__ in (None, "")) and (__spec__ is None):
@@ -65,11 +79,6 @@ DEFAULT_DESIGN = ""
 DEFAULT_TEST = ""
 
 
-@dataclass
-class _ContextBox:
-    value: dict[str, Any] | None = None
-
-
 @dataclass(frozen=True)
 class BuildCfg:  # pylint: disable=too-many-instance-attributes
     """Build configuration."""
@@ -102,7 +111,7 @@ class TestCfg:  # pylint: disable=too-many-instance-attributes
     test_args: list[str]
     extra_plusargs: list[str]
     extra_env: dict[str, str]
-    results_xml: Path | None
+    results_xml: Path
 
 
 # === CLI ===
@@ -201,6 +210,24 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Write the final seed list to a file (one per line).",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Seeds to run in parallel (0 = CPU count minus 2).",
+    )
+    ap.add_argument(
+        "--num-shards",
+        type=int,
+        default=1,
+        help="Split the seed list into N shards (e.g. one per CI machine).",
+    )
+    ap.add_argument(
+        "--shard-id",
+        type=int,
+        default=0,
+        help="Run only shard I (0-based) of --num-shards.",
+    )
     ap.add_argument(
         "--check-en",
         choices=["0", "1"],
@@ -230,13 +257,32 @@ def validate_args(args: argparse.Namespace) -> None:
         raise SystemExit("[dv]: error: argument --design required")
     if args.cmd in {"both", "test"} and not args.test:
         raise SystemExit(f"[dv]: error: argument --test required for {args.cmd=}")
+    if args.jobs < 0:
+        raise SystemExit("[dv]: error: argument --jobs must be >= 0")
+    if args.num_shards < 1:
+        raise SystemExit("[dv]: error: argument --num-shards must be >= 1")
+    if not 0 <= args.shard_id < args.num_shards:
+        raise SystemExit(
+            "[dv]: error: argument --shard-id must be in [0, --num-shards)"
+        )
+
+
+# Seed flags dropped from replay commands -> values to skip after the bare
+# flag form (None: every value up to the next flag)
+_SEED_FLAGS: Final[dict[str, int | None]] = {
+    "--nseeds": 1,
+    "--seeds": None,
+    "--num-shards": 1,
+    "--shard-id": 1,
+}
 
 
 def _strip_seed_args(argv: list[str]) -> list[str]:
     """Remove seed-related arguments from command-line argument list.
 
-    Removes --nseeds and --seeds arguments (both '--opt val' and '--opt=val' forms)
-    to enable replay commands with explicit seed values.
+    Removes --nseeds, --seeds and the shard selection arguments (both
+    '--opt val' and '--opt=val' forms) to enable replay commands with explicit
+    seed values.
 
     Args:
         argv: List of command-line arguments.
@@ -245,39 +291,46 @@ def _strip_seed_args(argv: list[str]) -> list[str]:
         New list with seed arguments removed.
     """
     out: list[str] = []
-    i = 0
-    while i < len(argv):
+    i, n = 0, len(argv)
+    while i < n:
         tok = argv[i]
-        if tok == "--nseeds":
-            i += 2  # skip flag + value
-            continue
-        if tok.startswith("--nseeds="):
-            i += 1
+        name, eq, _ = tok.partition("=")
+        i += 1
+        if name not in _SEED_FLAGS:
+            out.append(tok)
             continue
-        if tok == "--seeds":
-            i += 1
+        if eq:
+            continue  # '--opt=val': the value is in the same token
+        skip = _SEED_FLAGS[name]
+        if skip is None:
             # skip seed values until next flag or end
-            while i < len(argv) and not argv[i].startswith("-"):
+            while i < n and not argv[i].startswith("-"):
                 i += 1
-            continue
-        if tok.startswith("--seeds="):
-            i += 1
-            continue
-        out.append(tok)
-        i += 1
+        else:
+            i += skip
     return out
 
 
+# Characters shlex.quote leaves unquoted; tokens made only of these pass through.
+_SHELL_SAFE: Final[frozenset[str]] = frozenset(
+    string.ascii_letters + string.digits + "@%+=:,./-_"
+)
+
+
 def _pretty(argv: list[str]) -> str:
-    return " ".join(shlex.quote(a) for a in argv)
+    return " ".join(
+        a if a and _SHELL_SAFE.issuperset(a) else shlex.quote(a) for a in argv
+    )
 
 
 # === Context & Logging ===
 
-_CTX = _ContextBox()
+_CTX: ContextVar[Mapping[str, Any]] = ContextVar("dv_ctx")
+# Seed-invariant build config shared by every seed of one orchestration
+_BCFG: ContextVar[BuildCfg | None] = ContextVar("dv_bcfg", default=None)
 
 
-def _ctx() -> dict[str, Any]:
+def _ctx() -> Mapping[str, Any]:
     """Access the in-process context provided by the orchestrator.
 
     Returns:
@@ -286,9 +339,10 @@ def _ctx() -> dict[str, Any]:
     Raises:
         RuntimeError: If context has not been initialized.
     """
-    if _CTX.value is None:
-        raise RuntimeError("[dv] internal context not set")
-    return _CTX.value
+    try:
+        return _CTX.get()
+    except LookupError:
+        raise RuntimeError("[dv] internal context not set") from None
 
 
 def _configure_logging(verbosity: str) -> None:
@@ -338,6 +392,22 @@ def _derive_seeds(args: argparse.Namespace) -> list[int]:
         seeds = [utils.normalize_seed(rng, "random") for _ in range(args.nseeds)]
     else:
         seeds = [42]
+    # Each seed's test dir is named after it, so a repeated seed would rerun
+    # (or, with --jobs, race) in the same dir.
+    unique = list(dict.fromkeys(seeds))
+    if len(unique) != len(seeds):
+        print(f"[dv] dropping {len(seeds) - len(unique)} duplicate seed(s)")
+        seeds = unique
+    if args.num_shards > len(seeds):
+        # Some shard would run nothing yet report PASS
+        raise SystemExit(
+            f"[dv]: error: --num-shards={args.num_shards} exceeds the"
+            f" {len(seeds)} seed(s); use --seeds/--nseeds or fewer shards"
+        )
+    if args.num_shards > 1:
+        # Every shard derives the same list, so the slices are disjoint.
+        seeds = seeds[args.shard_id :: args.num_shards]
+        print(f"[dv] shard {args.shard_id} of {args.num_shards}")
     print(f"[dv] using seeds: {seeds}")
     return seeds
 
@@ -358,7 +428,23 @@ def _pytest_cmd_str(selector: str) -> str:
 # === Build/Test Config ===
 
 
-def _build_dir_for_ctx(ctx: dict) -> Path:
+@functools.lru_cache(maxsize=8)
+def _build_fingerprint(
+    sim: str,
+    waves: bool,
+    waves_fmt: str,
+    user_build_args: tuple[str, ...],
+) -> str:
+    """Return the 10-hex-char fingerprint of the build-affecting knobs.
+
+    Only a short stable label is needed, not a cryptographic digest, so a
+    5-byte BLAKE2b of the repr of the knob tuple is used.
+    """
+    raw = repr((sim, waves, waves_fmt, user_build_args)).encode()
+    return hashlib.blake2b(raw, digest_size=5).hexdigest()
+
+
+def _build_dir_for_ctx(ctx: Mapping[str, Any]) -> Path:
     """Generate build directory path with fingerprint hash.
 
     Creates a unique build directory path based on build-affecting parameters.
@@ -380,19 +466,28 @@ def _build_dir_for_ctx(ctx: dict) -> Path:
     user_build_args = [str(x) for x in ctx.get("user_build_args", [])]
 
     # Only include knobs that affect the compiled artifact.
-    fp_obj = {
-        "sim": sim,
-        "waves": waves,
-        "waves_fmt": waves_fmt if waves else "",
-        "user_build_args": user_build_args,
-    }
-    raw = json.dumps(fp_obj, sort_keys=True, separators=(",", ":")).encode()
-    build_hash = hashlib.sha1(raw).hexdigest()[:10]
+    build_hash = _build_fingerprint(
+        sim,
+        waves,
+        waves_fmt if waves else "",
+        tuple(user_build_args),
+    )
     leaf = f"{design}.{build_hash}"
 
     return (PROJ_DIR / outdir / DEFAULT_BUILDS_SUBDIR / leaf).resolve()
 
 
+def _write_json(path: Path, obj: dict[str, Any]) -> None:
+    """Write obj to path as indented JSON, replacing any previous file atomically.
+
+    The text is written to a sibling temp file and moved into place, so a
+    reader (or an interrupted run) never sees a half-written manifest.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def _write_build_manifest(cfg: "BuildCfg", *, status: str) -> None:
     """Write or update build manifest.json with current build status.
 
@@ -416,7 +511,7 @@ def _write_build_manifest(cfg: "BuildCfg", *, status: str) -> None:
         "build_args": cfg.build_args,  # final, ordered, verbatim
     }
     cfg.build_dir.mkdir(parents=True, exist_ok=True)
-    (cfg.build_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    _write_json(cfg.build_dir / "manifest.json", manifest)
 
 
 def _verilator_build_switches(waves: bool, waves_fmt: str) -> list[str]:
@@ -462,7 +557,7 @@ def _icarus_wave_plusarg(waves: bool, wave_file: Path) -> list[str]:
     return [f"+dumpfile_path={wave_file.resolve()}"]
 
 
-def _make_build_cfg(ctx: dict) -> BuildCfg:
+def _make_build_cfg(ctx: Mapping[str, Any]) -> BuildCfg:
     sim = str(ctx.get("sim", "verilator"))
     waves = bool(ctx.get("waves", True))
     waves_fmt = str(ctx.get("waves_fmt", "fst")).lower()
@@ -508,7 +603,8 @@ def _make_build_cfg(ctx: dict) -> BuildCfg:
     )
 
 
-def _make_test_cfg(ctx: dict) -> TestCfg:  # pylint: disable=too-many-locals
+def _make_test_cfg(ctx: Mapping[str, Any]) -> TestCfg:
+    # pylint: disable=too-many-locals
     sim = str(ctx.get("sim", "verilator"))
     outdir = str(ctx.get("outdir", DEFAULT_OUT_DIR))
     waves = bool(ctx.get("waves", True))
@@ -572,9 +668,9 @@ def _make_test_cfg(ctx: dict) -> TestCfg:  # pylint: disable=too-many-locals
     if extra_plusargs:
         extra_env["COCOTB_PLUSARGS"] = " ".join(extra_plusargs)
 
-    results_xml: Path | None = None
-    if os.getenv("PYTEST_CURRENT_TEST") is None:
-        results_xml = test_dir / "results.xml"
+    # Absolute so cocotb keeps it per-run even under pytest, where it would
+    # otherwise fall back to a shared name in the build dir.
+    results_xml = test_dir / "results.xml"
 
     return TestCfg(
         sim=sim,
@@ -598,6 +694,27 @@ def _make_test_cfg(ctx: dict) -> TestCfg:  # pylint: disable=too-many-locals
 # === Actions ===
 
 
+@contextlib.contextmanager
+def _build_lock(build_dir: Path, shared: bool = False) -> Iterator[None]:
+    """Hold a lock on build_dir for the duration of a build or a test.
+
+    Builds take the lock exclusively and tests take it shared, so dv
+    processes running in parallel (e.g. dv-regress --jobs) that share a
+    fingerprinted build dir never rebuild it while another is simulating.
+    """
+    try:
+        import fcntl  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        fcntl = None  # type: ignore[assignment]
+    if fcntl is None:  # no flock on this platform: run unlocked
+        yield
+        return
+    build_dir.mkdir(parents=True, exist_ok=True)
+    with (build_dir / ".build.lock").open("a", encoding="utf-8") as fh:
+        fcntl.flock(fh, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+
+
 def run_build(cfg: BuildCfg) -> None:
     """Execute the HDL build step using cocotb runner.
 
@@ -607,19 +724,25 @@ def run_build(cfg: BuildCfg) -> None:
     Args:
         cfg: Build configuration containing all necessary build parameters.
     """
+    # Deferred so --help and argument errors don't pay for the runner import.
+    from cocotb_tools.runner import (  # pylint: disable=import-outside-toplevel
+        get_runner,
+    )
+
     print("\n[dv] running build...\n")
     runner = get_runner(cfg.sim)
-    _write_build_manifest(cfg, status="started")
-    runner.build(
-        hdl_toplevel=cfg.design,
-        timescale=("1ns", "1ps"),
-        waves=cfg.waves,
-        build_dir=cfg.build_dir,
-        build_args=cfg.build_args,
-        log_file=str(cfg.build_log_file),
-        always=cfg.build_force,
-    )
-    _write_build_manifest(cfg, status="built")
+    with _build_lock(cfg.build_dir):
+        _write_build_manifest(cfg, status="started")
+        runner.build(
+            hdl_toplevel=cfg.design,
+            timescale=("1ns", "1ps"),
+            waves=cfg.waves,
+            build_dir=cfg.build_dir,
+            build_args=cfg.build_args,
+            log_file=str(cfg.build_log_file),
+            always=cfg.build_force,
+        )
+        _write_build_manifest(cfg, status="built")
 
 
 def run_test(cfg: TestCfg) -> None:
@@ -631,20 +754,26 @@ def run_test(cfg: TestCfg) -> None:
     Args:
         cfg: Test configuration containing all necessary test parameters.
     """
+    from cocotb_tools.runner import (  # pylint: disable=import-outside-toplevel
+        get_runner,
+    )
+
     print("\n[dv] running test...\n")
     runner = get_runner(cfg.sim)
-    runner.test(
-        hdl_toplevel_lang="verilog",
-        hdl_toplevel=cfg.design,
-        waves=cfg.waves,
-        build_dir=str(cfg.build_dir),
-        test_module=cfg.test_module,
-        log_file=str(cfg.test_log_file),
-        test_args=cfg.test_args,
-        plusargs=cfg.extra_plusargs,
-        extra_env=cfg.extra_env,
-        results_xml=str(cfg.results_xml) if cfg.results_xml else None,
-    )
+    with _build_lock(cfg.build_dir, shared=True):
+        runner.test(
+            hdl_toplevel_lang="verilog",
+            hdl_toplevel=cfg.design,
+            waves=cfg.waves,
+            build_dir=str(cfg.build_dir),
+            test_dir=str(cfg.test_dir),
+            test_module=cfg.test_module,
+            log_file=str(cfg.test_log_file),
+            test_args=cfg.test_args,
+            plusargs=cfg.extra_plusargs,
+            extra_env=cfg.extra_env,
+            results_xml=str(cfg.results_xml),
+        )
 
 
 # === Pytest Entrypoint ===
@@ -657,7 +786,7 @@ def test_framework() -> None:
     execution based on the in-process context. It handles logging configuration,
     build directory creation, and conditional execution of build and test phases.
 
-    The function uses the _CTX global to access configuration rather than
+    The function uses the _CTX context variable to access configuration rather than
     command-line arguments, allowing pytest to manage the test lifecycle.
     """
     ctx = _ctx()  # raises if not set
@@ -666,7 +795,7 @@ def test_framework() -> None:
     do_build = cmd in {"both", "build"}
     do_test = cmd in {"both", "test"} and bool(ctx.get("test", DEFAULT_TEST))
 
-    bcfg = _make_build_cfg(ctx)
+    bcfg = _BCFG.get() or _make_build_cfg(ctx)
     tcfg = _make_test_cfg(ctx)
 
     print(
@@ -694,7 +823,9 @@ def test_framework() -> None:
 # === Multi-seed Orchestration ===
 
 
-def _run_one_pytest(seed: int, test_dir: Path, ctx_base: dict) -> int:
+def _run_one_pytest(
+    seed: int, test_dir: Path, ctx_base: dict, bcfg: BuildCfg | None = None
+) -> int:
     """Execute a single pytest test run with the specified seed.
 
     Creates test-specific context, invokes pytest framework, generates test
@@ -702,55 +833,132 @@ def _run_one_pytest(seed: int, test_dir: Path, ctx_base: dict) -> int:
 
     Args:
         seed: Random seed for this test run.
-        test_dir: Directory where test outputs will be written.
+        test_dir: Existing directory where test outputs will be written.
         ctx_base: Base context dictionary to be extended with test-specific values.
+        bcfg: Prebuilt build configuration for ctx_base; computed by the
+            framework when omitted.
 
     Returns:
         0 if test result matches expectation, 1 otherwise.
     """
 
-    test_dir.mkdir(parents=True, exist_ok=True)
-
-    ctx = dict(ctx_base)
-    ctx["seed"] = seed
-    ctx["tests_root"] = str(test_dir.parent)
-    ctx["test_tag"] = test_dir.name
+    import pytest  # pylint: disable=import-outside-toplevel
 
-    _CTX.value = ctx
+    # Layer the per-seed keys over the shared base instead of copying it.
+    ctx = ChainMap(
+        {"seed": seed, "tests_root": str(test_dir.parent), "test_tag": test_dir.name},
+        ctx_base,
+    )
 
     sys.modules.setdefault("abe.rad.tools.dv", sys.modules[__name__])
 
     print(f"\n[dv] running {DEFAULT_FRAMEWORK} seed={seed} -> {test_dir}\n")
 
+    ctx_token = _CTX.set(ctx)
+    bcfg_token = _BCFG.set(bcfg)
+    try:
+        t0 = time.time()
+        framework_rc = pytest.main(_pytest_args(DEFAULT_FRAMEWORK))
+        t1 = time.time()
+    finally:
+        _BCFG.reset(bcfg_token)
+        _CTX.reset(ctx_token)
+    return _record_run(
+        ctx,
+        test_dir,
+        framework_rc=framework_rc,
+        duration=t1 - t0,
+        run_cmd=_pytest_cmd_str(DEFAULT_FRAMEWORK),
+        build_dir=bcfg.build_dir if bcfg else _build_dir_for_ctx(ctx),
+    )
+
+
+def _run_build_only(test_dir: Path, ctx_base: dict, bcfg: BuildCfg) -> int:
+    """Run the build step directly, without starting pytest (cmd=build).
+
+    Records the same manifest and result lines as a pytest run, so build-only
+    runs still show up in dv-report.
+
+    Args:
+        test_dir: Existing directory where the run manifest will be written.
+        ctx_base: Base context dictionary.
+        bcfg: Build configuration for ctx_base.
+
+    Returns:
+        0 if the build result matches expectation, 1 otherwise.
+    """
+    ctx = ChainMap(
+        {"seed": 0, "tests_root": str(test_dir.parent), "test_tag": test_dir.name},
+        ctx_base,
+    )
+    print(f"\n\n[dv] sim={bcfg.sim} cmd=build design={bcfg.design}")
+
     t0 = time.time()
-    framework_rc = pytest.main(_pytest_args(DEFAULT_FRAMEWORK))
+    try:
+        run_build(bcfg)
+        build_rc = 0
+        print(f"\n[dv] result: build: {bcfg.build_dir}")
+    except (Exception, SystemExit):  # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+        build_rc = 1
     t1 = time.time()
+
+    return _record_run(
+        ctx,
+        test_dir,
+        framework_rc=build_rc,
+        duration=t1 - t0,
+        run_cmd=_pretty(["python", "-m", "abe.rad.tools.dv", *ctx["orig_argv"]]),
+        build_dir=bcfg.build_dir,
+    )
+
+
+def _record_run(  # pylint: disable=too-many-arguments
+    ctx: Mapping[str, Any],
+    test_dir: Path,
+    *,
+    framework_rc: int,
+    duration: float,
+    run_cmd: str,
+    build_dir: Path,
+) -> int:
+    """Write a run's manifest and print its result and replay command.
+
+    Args:
+        ctx: Context of the run (including its seed).
+        test_dir: Directory the manifest is written to.
+        framework_rc: Exit code of the run; 0 means PASS.
+        duration: Wall time of the run in seconds.
+        run_cmd: Command string recorded as the manifest's "cmd".
+        build_dir: Build directory the run used.
+
+    Returns:
+        0 if the result matches expectation, 1 otherwise.
+    """
     status = "PASS" if framework_rc == 0 else "FAIL"
     expect = str(ctx.get("expect", "PASS")).strip().upper()
     rc = 0 if status == expect else 1
 
-    base_argv = list(_ctx().get("orig_argv", []))
-    replay_argv = _strip_seed_args(base_argv) + ["--seeds", str(seed)]
+    base_argv = list(ctx.get("orig_argv", []))
+    replay_argv = _strip_seed_args(base_argv) + ["--seeds", str(ctx["seed"])]
     replay_cmd = ["python", "-m", "abe.rad.tools.dv", *replay_argv]
     replay_cmd_str = _pretty(replay_cmd)
 
     manifest = {
         "status": status,
         "expect": expect,
-        "duration_s": round(t1 - t0, 3),
-        "cmd": _pytest_cmd_str(DEFAULT_FRAMEWORK),
+        "duration_s": round(duration, 3),
+        "cmd": run_cmd,
         "replay_cmd": replay_cmd_str,
-        "build_dir": str(_build_dir_for_ctx(ctx)),
+        "build_dir": str(build_dir),
         "test_dir": str(test_dir),
-        "ctx": dict(ctx.items()),
+        "ctx": dict(ctx),
     }
 
-    (test_dir / "manifest.json").write_text(
-        json.dumps(manifest, indent=2), encoding="utf-8"
-    )
+    _write_json(test_dir / "manifest.json", manifest)
 
     print(f"\n[dv] result: test_dir: {test_dir}")
-    print(f"[dv] result: duration: " f"{t1 - t0:.2f}s")
+    print(f"[dv] result: duration: " f"{duration:.2f}s")
     print(f"[dv] result: expect: {expect}")
     print(f"[dv] result: status: {status} (rc={framework_rc})\n")
 
@@ -766,10 +974,83 @@ def _run_one_pytest(seed: int, test_dir: Path, ctx_base: dict) -> int:
     return rc
 
 
+@contextlib.contextmanager
+def _capture_fds() -> Iterator[list[str]]:
+    """Send this process's stdout/stderr (fd level) to a temp file.
+
+    fd-level redirection also catches simulator subprocess output. Yields a
+    list that holds the captured text once the with block exits.
+    """
+    captured: list[str] = []
+    with tempfile.TemporaryFile() as out:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = (os.dup(1), os.dup(2))
+        os.dup2(out.fileno(), 1)
+        os.dup2(out.fileno(), 2)
+        try:
+            yield captured
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, dup in zip((1, 2), saved):
+                os.dup2(dup, fd)
+                os.close(dup)
+            out.seek(0)
+            captured.append(out.read().decode(errors="replace"))
+
+
+def _run_one_pytest_worker(
+    job: tuple[int, Path, dict, BuildCfg | None],
+) -> tuple[int, str]:
+    """Run one seed in a pool worker process; return its rc and output.
+
+    Logging setup is process-local, so the worker configures it before
+    handing off to _run_one_pytest (which sets the seed context). Output is
+    captured so the parent can print each seed's output in one piece.
+    """
+    seed, test_dir, ctx, bcfg = job
+    with _capture_fds() as captured:
+        _configure_logging(str(ctx.get("verbosity", "info")))
+        rc = _run_one_pytest(seed, test_dir, ctx, bcfg)
+    return rc, "".join(captured)
+
+
+def _run_seeds(
+    jobs: list[tuple[int, Path, dict, BuildCfg | None]], n_workers: int
+) -> int:
+    """Run the per-seed jobs, serially or across a process pool.
+
+    Seeds share the read-only build dir and write to their own test dirs, so
+    they are independent once the build exists. In the pool, each seed's
+    output is printed in one piece when it finishes so seeds don't interleave.
+
+    Args:
+        jobs: (seed, test_dir, ctx, bcfg) for each seed, in order.
+        n_workers: Maximum worker processes; 1 runs in this process.
+
+    Returns:
+        OR of the per-seed return codes.
+    """
+    rc = 0
+    if n_workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            rc |= _run_one_pytest(*job)
+        return rc
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs))) as ex:
+        futures = {ex.submit(_run_one_pytest_worker, job): job[0] for job in jobs}
+        for fut in as_completed(futures):
+            job_rc, out = fut.result()
+            print(f"\n[dv] seed {futures[fut]} finished (rc={job_rc})")
+            print(out, end="", flush=True)
+            rc |= job_rc
+    return rc
+
+
 # === Main ===
 
 
-def main(argv: Sequence[str] | None = None) -> int:
+def main(argv: Sequence[str] | None = None) -> int:  # pylint: disable=too-many-locals
     """Main entry point for DV test orchestration.
 
     Parses command-line arguments, configures logging, and orchestrates
@@ -807,26 +1088,40 @@ def main(argv: Sequence[str] | None = None) -> int:
         "coverage_en": (args.coverage_en == "1"),
     }
 
-    build_dir_name = _build_dir_for_ctx(ctx_base).name
+    # The build config does not depend on the seed; resolve it once for all runs.
+    bcfg = _make_build_cfg(ctx_base)
+    build_dir_name = bcfg.build_dir.name
 
-    # Even for cmd=build we go through pytest once (framework will skip test)
+    # Create the shared parent once; each seed dir is then a single mkdir.
+    tests_root.mkdir(parents=True, exist_ok=True)
+
+    # cmd=build skips pytest but still records a run manifest
     rc = 0
     if args.cmd == "build":
-        tag = f"{build_dir_name}.build_only"
-        rc = _run_one_pytest(0, tests_root / tag, ctx_base)
+        test_dir = tests_root / f"{build_dir_name}.build_only"
+        test_dir.mkdir(exist_ok=True)
+        rc = _run_build_only(test_dir, ctx_base, bcfg)
     else:
         seeds: list[int] = _derive_seeds(args)
+        jobs: list[tuple[int, Path, dict, BuildCfg | None]] = []
         for idx, seed in enumerate(seeds):
-            tag = f"{build_dir_name}.{args.test}.{seed}"
+            test_dir = tests_root / f"{build_dir_name}.{args.test}.{seed}"
+            test_dir.mkdir(exist_ok=True)
             per_ctx = dict(ctx_base)
             # Build once (first seed) when cmd=both; subsequent seeds run tests only.
             if ctx_base["cmd"] == "both" and idx > 0:
                 per_ctx["cmd"] = "test"
-            rc |= _run_one_pytest(seed, tests_root / tag, per_ctx)
+            jobs.append((seed, test_dir, per_ctx, bcfg))
+        n_workers = utils.resolve_jobs(args.jobs)
+        if ctx_base["cmd"] == "both" and jobs:
+            # The building seed must finish before the others use the build.
+            rc |= _run_one_pytest(*jobs[0])
+            jobs = jobs[1:]
+        rc |= _run_seeds(jobs, n_workers)
         if args.seed_out:
-            with Path(args.seed_out).open("w", encoding="utf-8", newline="\n") as f:
-                for s in seeds:
-                    f.write(f"{s}\n")
+            Path(args.seed_out).write_text(
+                "".join(f"{s}\n" for s in seeds), encoding="utf-8", newline="\n"
+            )
     return rc
 
 
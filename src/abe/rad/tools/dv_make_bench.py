@@ -17,7 +17,7 @@ The generator:
 - Runs static analysis on generated files
 
 Usage:
-    dv-make-bench <module_name> <author> [--year YEAR] [--force]
+    dv-make-bench <module_name> <author> [--year YEAR] [--force] [--no-static]
 
 Example:
     dv-make-bench rad_my_module "John Doe" --year 2025
@@ -28,12 +28,36 @@ This will create: src/abe/rad/rad_my_module/dv/
 from __future__ import annotations
 
 import argparse
+import re
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 from abe.utils import to_pascal_case, to_snake_case
 
+# Whole lines carrying the template-only pylint directives
+_TEMPLATE_PYLINT_RE = re.compile(
+    r"^[^\n]*# pylint: disable=(?:fixme|duplicate-code)[^\n]*(?:\n|$)", re.MULTILINE
+)
+
+
+def _substituter(substitutions: list[tuple[str, str]]) -> Callable[[str], str]:
+    """Return a function applying all substitutions in one regex pass.
+
+    Alternatives are tried longest key first, so a key that contains another
+    (rad_template vs template) is replaced as a whole.
+    """
+    mapping = dict(substitutions)
+    pattern = re.compile(
+        "|".join(re.escape(k) for k in sorted(mapping, key=len, reverse=True))
+    )
+
+    def substitute(text: str) -> str:
+        return pattern.sub(lambda m: mapping[m.group(0)], text)
+
+    return substitute
+
 
 def make_bench(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
     module_name: str,
@@ -45,8 +69,9 @@ def make_bench(  # pylint: disable=too-many-locals, too-many-branches, too-many-
     """Generate DV testbench from template.
 
     Copies the template directory and performs text substitutions to customize
-    the bench for the specified module. Substitutions are applied in a specific
-    order to ensure correctness (longer strings before shorter ones).
+    the bench for the specified module. Static analysis of the result is left
+    to the caller (see run_static_analysis). Substitutions are applied in a single
+    pass; where keys overlap the longer one wins (rad_template before template).
 
     The substitution process converts:
     - Module names: rad_template -> rad_<module>
@@ -96,8 +121,7 @@ def make_bench(  # pylint: disable=too-many-locals, too-many-branches, too-many-
     pascal_name = to_pascal_case(module_name)
     upper_name = snake_name.upper()
 
-    # Define substitutions - order matters for correct replacement
-    # Use a list of tuples to ensure we process in the right order
+    # Define substitutions (overlapping keys resolve longest-first)
     substitutions = [
         ("rad_template", snake_name),  # Full module path
         ("Author Name", author),  # Author name
@@ -107,6 +131,7 @@ def make_bench(  # pylint: disable=too-many-locals, too-many-branches, too-many-
         ("Template", pascal_name),  # Class names
         ("template", snake_name),  # Variable names, functions
     ]
+    substitute = _substituter(substitutions)
 
     print(f"Creating bench for module: {module_name}")
     print(f"  Snake case: {snake_name}")
@@ -116,73 +141,88 @@ def make_bench(  # pylint: disable=too-many-locals, too-many-branches, too-many-
 
     # Process each template file
     for template_file in template_dir.iterdir():
-        if template_file.is_file():
-            # Generate output filename
-            output_name = template_file.name
-            for old, new in substitutions:
-                output_name = output_name.replace(old, new)
-
-            output_file = target_dir / output_name
-
-            # Read template content
-            content = template_file.read_text()
-
-            # Apply substitutions in order
-            for old, new in substitutions:
-                content = content.replace(old, new)
-
-            # Remove pylint disable lines (keep errors visible in generated files)
-            lines = content.splitlines(keepends=True)
-            lines = [
-                line
-                for line in lines
-                if "# pylint: disable=fixme" not in line
-                and "# pylint: disable=duplicate-code" not in line
-            ]
-            content = "".join(lines)
-
-            # Write output file
-            output_file.write_text(content)
-            print(f"  Created: {output_file.name}")
+        if not template_file.is_file():
+            continue
+        # Generate output filename
+        output_name = substitute(template_file.name)
+
+        output_file = target_dir / output_name
+
+        # Read template content
+        content = substitute(template_file.read_text())
+
+        # Remove pylint disable lines (keep errors visible in generated files)
+        content = _TEMPLATE_PYLINT_RE.sub("", content)
+
+        # Write output file
+        output_file.write_text(content)
+        print(f"  Created: {output_file.name}")
 
     print(f"\nBench created successfully in {target_dir}")
 
-    # Run static analysis tools on generated files
+
+def run_static_analysis(target_dir: Path) -> subprocess.Popen[str] | None:
+    """Start the static analysis tools on a generated bench.
+
+    Returns without waiting so the caller can overlap other work; pass the
+    handle to finish_static_analysis() to collect and report the result.
+
+    Args:
+        target_dir: Directory of the generated bench.
+
+    Returns:
+        The running process, or None if it could not be started.
+    """
     print("\nRunning static analysis tools...")
     py_srcs_pattern = f"{target_dir}/*.py"
     cmd = ["make", f"PY_SRCS={py_srcs_pattern}", "py-static-fix"]
 
     try:
-        result = subprocess.run(
+        return subprocess.Popen(  # pylint: disable=consider-using-with
             cmd,
-            cwd=script_dir.parent.parent.parent.parent,  # repo root
-            capture_output=True,
+            cwd=Path(__file__).parent.parent.parent.parent.parent,  # repo root
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
         )
-
-        # Print output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-
-        if result.returncode == 0:
-            print("✓ Static analysis passed")
-        else:
-            print(f"⚠ Static analysis found issues (exit code {result.returncode})")
-            print("  This is intended - fix the FIXME items")
     except (FileNotFoundError, OSError) as e:
         print(f"⚠ Failed to run static analysis: {e}")
         print("  You can run it manually with:")
         print(f"  make PY_SRCS='{py_srcs_pattern}' py-static-fix")
+        return None
+
+
+def finish_static_analysis(proc: subprocess.Popen[str]) -> int:
+    """Wait for a run_static_analysis() process and print its result.
+
+    Args:
+        proc: Handle returned by run_static_analysis().
+
+    Returns:
+        The exit code of the static analysis run.
+    """
+    stdout, stderr = proc.communicate()
+
+    # Print output
+    if stdout:
+        print(stdout)
+    if stderr:
+        print(stderr)
+
+    if proc.returncode == 0:
+        print("✓ Static analysis passed")
+    else:
+        print(f"⚠ Static analysis found issues (exit code {proc.returncode})")
+        print("  This is intended - fix the FIXME items")
+    return proc.returncode
 
 
 def main() -> None:
     """Command-line interface entry point for testbench generation.
 
     Parses command-line arguments and invokes the make_bench function
-    to generate a new testbench from the template.
+    to generate a new testbench from the template, then runs static analysis
+    on it unless --no-static is given.
     """
     parser = argparse.ArgumentParser(
         description="Generate a DV testbench from template"
@@ -206,6 +246,11 @@ def main() -> None:
         action="store_true",
         help="Overwrite existing directory if it exists",
     )
+    parser.add_argument(
+        "--no-static",
+        action="store_true",
+        help="Skip the static analysis run on the generated files",
+    )
 
     args = parser.parse_args()
 
@@ -225,6 +270,11 @@ def main() -> None:
         force=args.force,
     )
 
+    if not args.no_static:
+        proc = run_static_analysis(target_dir)
+        if proc is not None:
+            finish_static_analysis(proc)
+
 
 if __name__ == "__main__":
     main()
@@ -14,6 +14,7 @@ Features:
 - Global default arguments applied to all jobs
 - Per-job argument overrides (job args take precedence)
 - Seed handling delegated to dv.py (supports --nseeds or --seeds)
+- Optional parallel job execution (--jobs)
 - Colored pass/fail report with copy-pasteable replay commands
 
 YAML Schema:
@@ -27,7 +28,7 @@ YAML Schema:
         args: "--design=... --test=..."  # Can also be a single string
 
 Usage:
-    dv-regress --file=path/to/dv_regress.yaml [--outdir=out_dv]
+    dv-regress --file=path/to/dv_regress.yaml [--outdir=out_dv] [--jobs=N]
 
 After running all jobs, prints a report:
   PASS: <cmd>
@@ -41,6 +42,8 @@ import argparse
 import shlex
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Sequence
@@ -51,6 +54,12 @@ from abe import utils
 
 DEFAULT_OUT_DIR = "out_dv"
 
+# libyaml's C loader when PyYAML was built with it; same safe schema either way
+_YamlLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Serializes the buffered output of jobs running in parallel
+_PRINT_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class Job:
@@ -75,6 +84,12 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     )
     ap.add_argument("--file", type=Path, help="Path to dv_regress.yaml")
     ap.add_argument("--outdir", default=DEFAULT_OUT_DIR, help="output directory")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="jobs to run in parallel (0 = CPU count minus 2)",
+    )
     return ap.parse_args(argv)
 
 
@@ -89,13 +104,18 @@ def _as_str_list(x: Any) -> list[str]:
 
     Returns:
         List of string arguments.
+
+    Raises:
+        ValueError: If x is not None, a string, or a list.
     """
     if x is None:
         return []
     if isinstance(x, str):
         # allow a single string with spaces or a YAML list
         return shlex.split(x)
-    return [str(t) for t in list(x)]
+    if not isinstance(x, list):
+        raise ValueError(f"'args' must be a string or a list, got {x!r}")
+    return [str(t) for t in x]
 
 
 def _load_config(path: Path) -> tuple[list[str], list[Job]]:
@@ -111,11 +131,13 @@ def _load_config(path: Path) -> tuple[list[str], list[Job]]:
     Raises:
         ValueError: If YAML structure is invalid or jobs list is empty.
     """
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     if not isinstance(data, dict):
         raise ValueError("dv_regress.yaml must be a mapping")
 
     defaults = data.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise ValueError("'defaults' must be a mapping")
     default_args = _as_str_list(defaults.get("args"))
 
     jobs_raw = data.get("jobs")
@@ -145,11 +167,55 @@ def _pretty_cmd(cmd: Sequence[str]) -> str:
     return " ".join(shlex.quote(x) for x in cmd)
 
 
+def _run_job(name: str, cmd: list[str], capture: bool) -> int:
+    """Run one job's dv command and return its exit code.
+
+    With capture set (parallel runs), the job's output is buffered and printed
+    in one piece under _PRINT_LOCK so concurrent jobs don't interleave.
+    """
+    if not capture:
+        # The child writes straight to our stdout; emit our buffered lines first.
+        sys.stdout.flush()
+        return subprocess.run(cmd, check=False).returncode
+    rc, out = utils.run_captured(cmd)
+    with _PRINT_LOCK:
+        print(f"\n[dv_regress] job: {name} (rc={rc})")
+        print(out, end="", flush=True)
+    return rc
+
+
+def _run_jobs(
+    jobs: list[Job], cmds: list[list[str]], cmd_strs: list[str], n_workers: int
+) -> list[int]:
+    """Run the jobs' commands and return their exit codes in job order.
+
+    Jobs run in this thread when n_workers is 1; otherwise up to n_workers
+    run at once on a thread pool (each thread just waits on its subprocess).
+    """
+    if n_workers <= 1:
+        rcs: list[int] = []
+        for job, cmd, cmd_str in zip(jobs, cmds, cmd_strs):
+            print(f"\n[dv_regress] job: {job.name}")
+            print(f"[dv_regress] cmd: {cmd_str}\n")
+            rcs.append(_run_job(job.name, cmd, capture=False))
+        return rcs
+
+    print(f"[dv_regress] running {len(jobs)} jobs, {n_workers} at a time")
+    for job, cmd_str in zip(jobs, cmd_strs):
+        print(f"[dv_regress] cmd: {job.name}: {cmd_str}")
+    with ThreadPoolExecutor(max_workers=n_workers) as ex:
+        futures = [
+            ex.submit(_run_job, job.name, cmd, True) for job, cmd in zip(jobs, cmds)
+        ]
+        return [f.result() for f in futures]
+
+
 def run_regress(args: argparse.Namespace) -> int:
     """Execute all regression jobs defined in the YAML file.
 
-    Loads the configuration, runs each job sequentially, and prints a summary
-    report with pass/fail status and replay commands.
+    Loads the configuration, runs the jobs (sequentially, or up to --jobs at a
+    time), and prints a summary report with pass/fail status and replay
+    commands.
 
     Args:
         args: Parsed command-line arguments containing file path and output dir.
@@ -171,17 +237,21 @@ def run_regress(args: argparse.Namespace) -> int:
     passes: list[str] = []
     fails: list[str] = []
 
-    for job in jobs:
-        cmd = [
+    cmds = [
+        [
             "dv",
             *default_args,
             *job.args,
             f"--outdir={args.outdir}",
         ]
-        cmd_str = _pretty_cmd(cmd)
-        print(f"\n[dv_regress] job: {job.name}")
-        print(f"[dv_regress] cmd: {cmd_str}\n")
-        job_rc = subprocess.run(cmd, check=False).returncode
+        for job in jobs
+    ]
+    cmd_strs = [_pretty_cmd(cmd) for cmd in cmds]
+    n_workers = min(len(jobs), utils.resolve_jobs(args.jobs))
+
+    rcs = _run_jobs(jobs, cmds, cmd_strs, n_workers)
+
+    for cmd_str, job_rc in zip(cmd_strs, rcs):
         if job_rc == 0:
             passes.append(cmd_str)
         else:
@@ -213,6 +283,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         0 if regression passes, non-zero otherwise.
     """
     args = parse_args(argv)
+    if args.jobs < 0:
+        raise SystemExit("[dv_regress]: error: argument --jobs must be >= 0")
     return run_regress(args)
 
 
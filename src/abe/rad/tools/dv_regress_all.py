@@ -8,16 +8,17 @@
 
 This module provides a convenient way to run all regression suites defined
 across the entire repository. It recursively searches for dv_regress.yaml files
-and executes each one using the dv-regress command.
+and executes each one with the dv-regress runner.
 
 Features:
 - Recursive search from specified root directories
 - Filters out common non-test directories (.git, .venv, etc.)
 - All regressions share the same output directory
+- Optional parallel execution of the regressions (--jobs)
 - Colored summary report of overall pass/fail status
 
 Usage:
-    dv-regress-all [--roots DIR1 DIR2 ...] [--outdir=out_dv]
+    dv-regress-all [--roots DIR1 DIR2 ...] [--outdir=out_dv] [--jobs=N]
 
 Example:
     dv-regress-all                     # Search from current directory
@@ -28,12 +29,16 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator, Sequence
 
+import yaml
+
 from abe import utils
+from abe.rad.tools import dv_regress
 
 DEFAULT_OUT_DIR = "out_dv"
 
@@ -48,6 +53,9 @@ _IGNORE_DIRS = {
     "waves",
 }
 
+# Serializes the buffered output of regressions running in parallel
+_PRINT_LOCK = threading.Lock()
+
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments for running all regressions.
@@ -70,27 +78,41 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         help="roots to scan (default: .)",
     )
     ap.add_argument("--outdir", default=DEFAULT_OUT_DIR, help="output directory")
+    ap.add_argument(
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="regressions to run in parallel (0 = CPU count minus 2)",
+    )
     return ap.parse_args(argv)
 
 
 def _walk_find(root: Path, filename: str) -> Iterator[Path]:
     """Recursively search for files with the given name.
 
-    Walks the directory tree, pruning common non-test directories to
-    improve search performance.
+    Walks the directory tree with os.scandir, pruning common non-test
+    directories and using the type information cached on each DirEntry, so
+    matching files need no extra stat. Symlinked directories are not followed
+    and unreadable directories are skipped.
 
     Args:
         root: Root directory to start the search.
         filename: Filename to search for.
 
     Yields:
-        Paths to matching files.
+        Paths to matching regular files.
     """
-    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
-        # prune in-place
-        dirnames[:] = [d for d in dirnames if d not in _IGNORE_DIRS]
-        if filename in filenames:
-            yield Path(dirpath, filename)
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _IGNORE_DIRS:
+                yield from _walk_find(Path(entry.path), filename)
+        elif entry.name == filename and entry.is_file():
+            yield Path(entry.path)
 
 
 def _find_yamls(roots: list[Path]) -> list[Path]:
@@ -115,11 +137,41 @@ def _find_yamls(roots: list[Path]) -> list[Path]:
             )
             sys.exit(2)
         for p in _walk_find(root, "dv_regress.yaml"):
-            if p.is_file():
-                seen.add(p.resolve())
+            seen.add(p.resolve())
     return sorted(seen)
 
 
+def _run_one_regress(y: Path, outdir: str, capture: bool = False) -> int:
+    """Run dv-regress on one YAML file and return its exit code.
+
+    Serial runs call dv_regress.run_regress in this process, skipping a
+    dv-regress interpreter start per YAML. With capture set (parallel runs),
+    dv-regress runs as a subprocess whose output is buffered and printed in
+    one piece once it finishes so concurrent runs don't interleave.
+    """
+    if not capture:
+        print(f"\n[dv_regress_all] Starting regression {y}")
+        try:
+            return dv_regress.run_regress(
+                argparse.Namespace(file=y, outdir=outdir, jobs=1)
+            )
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"[dv_regress_all] Error: {y}: {e}", file=sys.stderr)
+            return 1
+    cmd = [
+        "dv-regress",
+        "--file",
+        str(y),
+        "--outdir",
+        outdir,
+    ]
+    rc, out = utils.run_captured(cmd)
+    with _PRINT_LOCK:
+        print(f"\n[dv_regress_all] Finished regression {y} (rc={rc})")
+        print(out, end="", flush=True)
+    return rc
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     """Command-line entry point for running all repository regressions.
 
@@ -133,6 +185,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         0 if all regressions pass, non-zero if any fail.
     """
     args = parse_args(argv)
+    if args.jobs < 0:
+        raise SystemExit("[dv_regress_all]: error: argument --jobs must be >= 0")
     yamls = _find_yamls([r.resolve() for r in args.roots])
 
     if not yamls:
@@ -149,19 +203,21 @@ def main(argv: Sequence[str] | None = None) -> int:
     for y in yamls:
         print(f"{str(y)}")
 
-    overall_rc = 0
-    for y in yamls:
-        print(f"\n[dv_regress_all] Starting regression {y}")
-        cmd = [
-            "dv-regress",
-            "--file",
-            str(y),
-            "--outdir",
-            args.outdir,
-        ]
-        rc = subprocess.run(cmd, check=False).returncode
-        if rc != 0:
-            overall_rc = 1
+    n_workers = min(len(yamls), utils.resolve_jobs(args.jobs))
+    if n_workers <= 1:
+        rcs = [_run_one_regress(y, args.outdir) for y in yamls]
+    else:
+        # Each worker only waits on its dv-regress subprocess, so threads do.
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            rcs = list(
+                ex.map(
+                    _run_one_regress,
+                    yamls,
+                    [args.outdir] * len(yamls),
+                    [True] * len(yamls),
+                )
+            )
+    overall_rc = int(any(rcs))
 
     print(f"\n[dv_regress_all] Completed regressions: {len(yamls)}")
     rep = f"dv-report --outdir={args.outdir}"
@@ -35,7 +35,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
@@ -45,6 +47,21 @@ from abe import utils
 DEFAULT_OUT_DIR = "out_dv"
 DEFAULT_TESTS_SUBDIR = "tests"
 
+# Colored label per (status, expect), in report order
+_LABELS: dict[tuple[str, str], str] = {
+    ("PASS", "PASS"): utils.green("PASS (EXPECTED)"),
+    ("FAIL", "FAIL"): utils.green("FAIL (EXPECTED)"),
+    ("PASS", "FAIL"): utils.red("PASS (UNEXPECTED)"),
+    ("FAIL", "PASS"): utils.red("FAIL (UNEXPECTED)"),
+}
+
+# Directories under a test dir that never contain manifests
+_IGNORE_DIRS = {
+    "__pycache__",
+    ".pytest_cache",
+    "waves",
+}
+
 
 @dataclass(frozen=True)
 class TestRun:
@@ -92,11 +109,11 @@ def collect(tests_root: Path) -> list[TestRun]:
         )
         return []
     print(f"\n[dv_report] Scanning for test manifests in {tests_root}")
-    runs: list[TestRun] = []
-    for d in _find_manifest_dirs(tests_root):
-        tr = _load_run(d)
-        if tr is not None:
-            runs.append(tr)
+    # Manifest reads are I/O-bound and independent; load them concurrently.
+    dirs = _find_manifest_dirs(tests_root)
+    n_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(dirs)))
+    with ThreadPoolExecutor(max_workers=n_workers) as ex:
+        runs = [tr for tr in ex.map(_load_run, dirs) if tr is not None]
     # Sort by path for determinism
     runs.sort(key=lambda r: str(r.path))
     return runs
@@ -105,21 +122,22 @@ def collect(tests_root: Path) -> list[TestRun]:
 def _find_manifest_dirs(tests_root: Path) -> list[Path]:
     """Find all directories containing manifest.json files.
 
+    Walks the tree once, pruning directories that never hold manifests. Each
+    directory is visited once, so the result has no duplicates; it is not
+    sorted (collect sorts the runs).
+
     Args:
         tests_root: Root directory to search.
 
     Returns:
-        List of unique directory paths containing manifest.json files.
+        List of directory paths containing manifest.json files.
     """
-    dirs: list[Path] = []
     out: list[Path] = []
-    seen: set[Path] = set()
-    for p in sorted(tests_root.glob("**/manifest.json")):
-        dirs.append(p.parent)
-    for d in dirs:
-        if d not in seen:
-            out.append(d)
-            seen.add(d)
+    for dirpath, dirnames, filenames in os.walk(tests_root, followlinks=False):
+        # prune in-place
+        dirnames[:] = [d for d in dirnames if d not in _IGNORE_DIRS]
+        if "manifest.json" in filenames:
+            out.append(Path(dirpath))
     return out
 
 
@@ -134,7 +152,7 @@ def _load_run(run_dir: Path) -> TestRun | None:
     """
     mpath = run_dir / "manifest.json"
     try:
-        data = json.loads(mpath.read_text(encoding="utf-8"))
+        data = json.loads(mpath.read_bytes())
     except (OSError, UnicodeDecodeError, json.JSONDecodeError):
         return None
     status = str(data.get("status", "")).strip().upper()
@@ -149,6 +167,23 @@ def _load_run(run_dir: Path) -> TestRun | None:
     return TestRun(path=run_dir, status=status, expect=expect, replay_cmd=replay_cmd)
 
 
+def _categorize(runs: Sequence[TestRun]) -> dict[tuple[str, str], list[TestRun]]:
+    """Bucket runs by (status, expect) in a single pass, keeping run order.
+
+    Args:
+        runs: Sequence of TestRun objects.
+
+    Returns:
+        Mapping of each (status, expect) pair to its runs.
+    """
+    buckets: dict[tuple[str, str], list[TestRun]] = {key: [] for key in _LABELS}
+    for r in runs:
+        bucket = buckets.get((r.status, r.expect))
+        if bucket is not None:
+            bucket.append(r)
+    return buckets
+
+
 def print_report(tests_root: Path, runs: Sequence[TestRun]) -> int:
     """Print a formatted report of test results.
 
@@ -168,31 +203,24 @@ def print_report(tests_root: Path, runs: Sequence[TestRun]) -> int:
         return 1
     print(f"[dv_report] Results from test manifests in {tests_root}\n")
 
-    xpasses = [r for r in runs if r.status == "PASS" and r.expect == "PASS"]
-    xfails = [r for r in runs if r.status == "FAIL" and r.expect == "FAIL"]
-    upasses = [r for r in runs if r.status == "PASS" and r.expect == "FAIL"]
-    ufails = [r for r in runs if r.status == "FAIL" and r.expect == "PASS"]
+    buckets = _categorize(runs)
+    upasses = buckets["PASS", "FAIL"]
+    ufails = buckets["FAIL", "PASS"]
 
     rc = 0 if not (upasses or ufails) else 1
 
-    for r in xpasses:
-        print(f"{utils.green('PASS (EXPECTED)')}: {r.replay_cmd}")
-    for r in xfails:
-        print(f"{utils.green('FAIL (EXPECTED)')}: {r.replay_cmd}")
-    for r in upasses:
-        print(f"{utils.red('PASS (UNEXPECTED)')}: {r.replay_cmd}")
-    for r in ufails:
-        print(f"{utils.red('FAIL (UNEXPECTED)')}: {r.replay_cmd}")
+    # One write for the whole run listing rather than a print per run
+    lines = [
+        f"{label}: {r.replay_cmd}\n"
+        for key, label in _LABELS.items()
+        for r in buckets[key]
+    ]
+    sys.stdout.write("".join(lines))
 
     print(f"\n[dv_report] TOTALS: {len(runs)}\n")
-    if len(xpasses):
-        print(f"{utils.green('PASS (EXPECTED)')}: {len(xpasses)}")
-    if len(xfails):
-        print(f"{utils.green('FAIL (EXPECTED)')}: {len(xfails)}")
-    if len(upasses):
-        print(f"{utils.red('PASS (UNEXPECTED)')}: {len(upasses)}")
-    if len(ufails):
-        print(f"{utils.red('FAIL (UNEXPECTED)')}: {len(ufails)}")
+    for key, label in _LABELS.items():
+        if buckets[key]:
+            print(f"{label}: {len(buckets[key])}")
 
     if rc != 0:
         print(f"\n[dv_report] SUMMARY: {utils.red('FAIL (unexpected outcomes)')}")
@@ -9,9 +9,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import random
 import re
+import subprocess
 import time
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Sequence, Union
@@ -267,6 +270,26 @@ def round_value(value: int, rounding: str) -> int:
     raise ValueError(f"Unknown rounding: {rounding}")
 
 
+def resolve_jobs(jobs: int) -> int:
+    """Return the worker count for a --jobs value; 0 means CPU count minus 2."""
+    # Leave two cores for the orchestrator and the rest of the machine.
+    return jobs or max(1, (os.cpu_count() or 1) - 2)
+
+
+def run_captured(cmd: Sequence[str]) -> tuple[int, str]:
+    """Run cmd to completion; return its exit code and combined stdout/stderr."""
+    proc = subprocess.run(
+        list(cmd),
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    return proc.returncode, proc.stdout
+
+
+@lru_cache(maxsize=256)
 def to_snake_case(name: str) -> str:
     """Convert module name to snake_case.
 
@@ -283,6 +306,7 @@ def to_snake_case(name: str) -> str:
     return "".join(result)
 
 
+@lru_cache(maxsize=256)
 def to_pascal_case(name: str) -> str:
     """Convert module name to PascalCase.
 
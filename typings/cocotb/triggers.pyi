@@ -16,6 +16,11 @@ class _Trigger(Awaitable[Any]):
 class Edge(_Trigger):
     """Edge trigger"""
 
+class ClockCycles(_Trigger):
+    """ClockCycles"""
+
+    def __init__(self, signal: Any, num_cycles: int, *, rising: bool = ...) -> None: ...
+
 class NextTimeStep(_Trigger):
     """NextTimeStep"""
 
@@ -34,6 +34,8 @@ class uvm_object:  # pylint: disable=invalid-name disable=too-few-public-methods
     """uvm_object"""
 
     def __init__(self, name: str = ...) -> None: ...
+    def get_name(self) -> str:
+        """get_name"""
 
 class uvm_component:  # pylint: disable=invalid-name
     """uvm_component"""
@@ -89,6 +91,8 @@ class ConfigDB:  # pylint: disable=too-few-public-methods
 class uvm_analysis_port(Generic[T]):  # pylint: disable=invalid-name
     """uvm_analysis_port"""
 
+    subscribers: list[Any]
+
     def __init__(self, name: str, parent: uvm_component) -> None: ...
     def write(self, datum: T) -> None:
         """write"""
@@ -116,6 +120,9 @@ class uvm_tlm_analysis_fifo(Generic[T], uvm_component):  # pylint: disable=inval
     async def get(self) -> T:
         """get"""
 
+    def try_get(self) -> tuple[bool, T | None]:
+        """try_get"""
+
     def write(self, item: T) -> None:
         """write"""
 
@@ -196,6 +203,11 @@ class UVMFactory:
     ) -> OT:
         """create_object_by_type"""
 
+    def find_override_by_type(
+        self, requested_type: Type[OT], full_inst_path: str
+    ) -> Type[OT] | None:
+        """find_override_by_type"""
+
     def set_type_override_by_type(
         self, original_type: Any, override_type: Any, replace: bool = True
     ) -> None: